@@ -16,6 +16,8 @@ Usage:
     print(to_json(design, validation))
 """
 
+from importlib import import_module
+
 from .core import (
     # Dataclasses
     WormParameters,
@@ -29,6 +31,9 @@ from .core import (
 
     # Constants
     STANDARD_MODULES,
+    SMALL_MODULES,
+    MEDIUM_MODULES,
+    LARGE_MODULES,
 
     # Functions
     design_from_envelope,
@@ -42,25 +47,57 @@ from .core import (
     calculate_manufacturing_params,
     nearest_standard_module,
     is_standard_module,
+    classify_module,
     estimate_efficiency,
 )
 
-from .validation import (
-    ValidationResult,
-    ValidationMessage,
-    Severity,
-    validate_design,
-    create_design_result,
-    calculate_minimum_teeth,
-    calculate_profile_shift,
-)
+# Validation, output and batch names are imported on first access (PEP 562),
+# so `import wormcalc` for design work alone only loads core.
+_LAZY_IMPORTS = {
+    # Validation
+    "ValidationResult": "validation",
+    "ValidationMessage": "validation",
+    "Severity": "validation",
+    "validate_design": "validation",
+    "clear_validation_cache": "validation",
+    "is_valid": "validation",
+    "create_design_result": "validation",
+    "calculate_minimum_teeth": "validation",
+    "calculate_profile_shift": "validation",
 
-from .output import (
-    to_json,
-    to_markdown,
-    to_summary,
-    design_to_dict,
-)
+    # Output
+    "to_json": "output",
+    "to_markdown": "output",
+    "to_summary": "output",
+    "design_to_dict": "output",
+
+    # Batch calculations
+    "DesignBatch": "batch",
+    "BATCH_COLUMNS": "batch",
+    "calculate_worm_batch": "batch",
+    "calculate_wheel_batch": "batch",
+    "design_from_envelope_batch": "batch",
+    "design_from_centre_distance_batch": "batch",
+    "design_grid": "batch",
+    "is_valid_batch": "batch",
+    "estimate_efficiency_batch": "batch",
+    "nearest_standard_module_batch": "batch",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 __version__ = "0.1.0"
@@ -85,6 +122,9 @@ __all__ = [
 
     # Constants
     "STANDARD_MODULES",
+    "SMALL_MODULES",
+    "MEDIUM_MODULES",
+    "LARGE_MODULES",
 
     # Design functions
     "design_from_envelope",
@@ -100,10 +140,13 @@ __all__ = [
     # Utility functions
     "nearest_standard_module",
     "is_standard_module",
+    "classify_module",
     "estimate_efficiency",
 
     # Validation
     "validate_design",
+    "clear_validation_cache",
+    "is_valid",
     "create_design_result",
     "calculate_minimum_teeth",
     "calculate_profile_shift",
@@ -113,4 +156,16 @@ __all__ = [
     "to_markdown",
     "to_summary",
     "design_to_dict",
+
+    # Batch calculations
+    "DesignBatch",
+    "BATCH_COLUMNS",
+    "calculate_worm_batch",
+    "calculate_wheel_batch",
+    "design_from_envelope_batch",
+    "design_from_centre_distance_batch",
+    "design_grid",
+    "is_valid_batch",
+    "estimate_efficiency_batch",
+    "nearest_standard_module_batch",
 ]
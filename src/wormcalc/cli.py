@@ -6,23 +6,15 @@ Usage:
     wormcalc from-wheel --wheel-od 65 --ratio 30
     wormcalc from-module --module 2 --ratio 30
     wormcalc from-centre-distance --centre-distance 40 --ratio 30
+    wormcalc batch candidates.csv
 """
 
 import sys
 import click
 from typing import Optional
 
-from .core import (
-    Hand,
-    WormProfile,
-    WormType,
-    design_from_envelope,
-    design_from_wheel,
-    design_from_module,
-    design_from_centre_distance,
-)
-from .validation import validate_design
-from .output import to_json, to_markdown, to_summary, validation_summary
+# Calculator modules are imported inside each command, so a run only loads
+# what that subcommand needs (list-modules never touches validation/output).
 
 
 # Common options
@@ -74,6 +66,8 @@ def envelope(worm_od: float, wheel_od: float, ratio: int,
 
     Use when you have specific envelope (space) constraints for both gears.
     """
+    from .core import Hand, WormProfile, WormType, design_from_envelope
+
     design = design_from_envelope(
         worm_od=worm_od,
         wheel_od=wheel_od,
@@ -106,6 +100,8 @@ def from_wheel(wheel_od: float, ratio: int, target_lead_angle: float,
     Worm is sized automatically to achieve target lead angle.
     Use when wheel size is constrained but worm size is flexible.
     """
+    from .core import Hand, WormProfile, WormType, design_from_wheel
+
     design = design_from_wheel(
         wheel_od=wheel_od,
         ratio=ratio,
@@ -139,6 +135,8 @@ def from_module(module: float, ratio: int, worm_pitch_dia: Optional[float],
 
     Traditional approach using standard module values.
     """
+    from .core import Hand, WormProfile, WormType, design_from_module
+
     design = design_from_module(
         module=module,
         ratio=ratio,
@@ -172,6 +170,8 @@ def from_centre_distance(centre_distance: float, ratio: int, worm_wheel_ratio: f
 
     Use when fitting into existing housing with fixed shaft positions.
     """
+    from .core import Hand, WormProfile, WormType, design_from_centre_distance
+
     design = design_from_centre_distance(
         centre_distance=centre_distance,
         ratio=ratio,
@@ -188,6 +188,81 @@ def from_centre_distance(centre_distance: float, ratio: int, worm_wheel_ratio: f
     _output_design(design, output, no_validate)
 
 
+@cli.command()
+@click.argument('csv_file', type=click.File('r'))
+@click.option('--pressure-angle', '-pa', default=20.0,
+              help='Pressure angle in degrees (default: 20)')
+@click.option('--backlash', '-b', default=0.0,
+              help='Backlash allowance in mm (default: 0)')
+@click.option('--output', '-o', type=click.Choice(['csv', 'jsonl']), default='csv',
+              help='Output format: CSV or one JSON object per line (default: csv)')
+def batch(csv_file, pressure_angle: float, backlash: float, output: str):
+    """
+    Design many envelope candidates from a CSV file.
+
+    CSV_FILE needs worm_od, wheel_od and ratio columns, plus an optional
+    num_starts column (default 1). Use - to read from stdin. Cylindrical
+    worms only; no validation is run.
+    """
+    import csv
+    import io
+    import json
+    from .batch import BATCH_COLUMNS, design_from_envelope_batch
+
+    reader = csv.DictReader(csv_file)
+    missing = {'worm_od', 'wheel_od', 'ratio'} - set(reader.fieldnames or ())
+    if missing:
+        raise click.UsageError(f"CSV is missing column(s): {', '.join(sorted(missing))}")
+
+    worm_ods, wheel_ods, ratios, starts, line_nums = [], [], [], [], []
+    try:
+        for row in reader:
+            worm_ods.append(float(row['worm_od']))
+            wheel_ods.append(float(row['wheel_od']))
+            ratios.append(int(row['ratio']))
+            starts.append(int(row.get('num_starts') or 1))
+            line_nums.append(reader.line_num)
+            if min(worm_ods[-1], wheel_ods[-1], ratios[-1], starts[-1]) <= 0:
+                raise ValueError("worm_od, wheel_od, ratio and num_starts must be positive")
+    except (TypeError, ValueError) as e:
+        # TypeError: DictReader fills fields missing from a short row with None
+        raise click.UsageError(f"Bad value on CSV line {reader.line_num}: {e}")
+
+    def design_rows(i=slice(None)):
+        return design_from_envelope_batch(
+            worm_ods[i], wheel_ods[i], ratios[i], starts[i],
+            pressure_angle=pressure_angle,
+            backlash=backlash
+        )
+
+    try:
+        result = design_rows()
+    except ZeroDivisionError:
+        # Rerun row by row to find which one has no valid geometry
+        for i, line_num in enumerate(line_nums):
+            try:
+                design_rows(slice(i, i + 1))
+            except ZeroDivisionError:
+                raise click.UsageError(
+                    f"Bad value on CSV line {line_num}: worm_od and wheel_od "
+                    f"give a zero worm pitch diameter"
+                )
+        raise
+
+    names = BATCH_COLUMNS
+    rows = zip(*(getattr(result, name) for name in names))
+
+    if output == 'jsonl':
+        for row in rows:
+            click.echo(json.dumps(dict(zip(names, row))))
+    else:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(names)
+        writer.writerows(rows)
+        click.echo(buffer.getvalue(), nl=False)
+
+
 @cli.command()
 @click.option('--module', '-m', required=True, type=float, help='Module to check')
 def check_module(module: float):
@@ -216,24 +291,21 @@ def list_modules():
     """
     List all standard modules (ISO 54 / DIN 780).
     """
-    from .core import STANDARD_MODULES
+    from .core import SMALL_MODULES, MEDIUM_MODULES, LARGE_MODULES
     
     click.echo("Standard Modules (ISO 54 / DIN 780):")
     click.echo("────────────────────────────────────")
     
-    # Group by size range
-    small = [m for m in STANDARD_MODULES if m < 1]
-    medium = [m for m in STANDARD_MODULES if 1 <= m < 5]
-    large = [m for m in STANDARD_MODULES if m >= 5]
-    
-    click.echo(f"Small (<1mm):   {', '.join(f'{m}' for m in small)}")
-    click.echo(f"Medium (1-5mm): {', '.join(f'{m}' for m in medium)}")
-    click.echo(f"Large (≥5mm):   {', '.join(f'{m}' for m in large)}")
+    click.echo(f"Small (<1mm):   {', '.join(f'{m}' for m in SMALL_MODULES)}")
+    click.echo(f"Medium (1-5mm): {', '.join(f'{m}' for m in MEDIUM_MODULES)}")
+    click.echo(f"Large (≥5mm):   {', '.join(f'{m}' for m in LARGE_MODULES)}")
 
 
 def _output_design(design, output_format: str, skip_validation: bool):
     """Output design in requested format"""
-    
+    from .validation import validate_design
+    from .output import to_json, to_markdown, to_summary, validation_summary
+
     validation = None if skip_validation else validate_design(design)
     
     if output_format == 'json':
@@ -8,18 +8,46 @@ Engineering validation based on:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from threading import Lock
+from itertools import chain
+from typing import Dict, FrozenSet, Iterator, List, Optional
 from enum import Enum
 
 from .core import (
     WormGearDesign, DesignResult,
-    is_standard_module, nearest_standard_module,
+    classify_module,
     STANDARD_MODULES,
     WormType, WormProfile
 )
 from math import sin, radians
 
 
+# ERROR-level limits, shared by the _validate_* rules, is_valid and
+# batch.is_valid_batch so the three can't drift apart
+_MIN_LEAD_ANGLE = 1.0                 # degrees
+_MIN_MODULE = 0.3                     # mm
+_MIN_WORM_DIA_TO_MODULE = 3.0         # worm pitch diameter / module
+_MIN_WORM_ROOT_DIAMETER = 2.0         # mm
+_MIN_CLEARANCE = 0.0                  # mm, worm tip to wheel root; less is interference
+_MIN_THROAT_REDUCTION = 0.02          # mm; smaller only warns, upper limits not checked
+_MAX_THROAT_REDUCTION_FRACTION = 0.5  # of module
+
+
+@lru_cache(maxsize=64)
+def _minimum_teeth_formula(pressure_angle_deg: float) -> int:
+    """z_min = 2 / sin²(α), rounded up"""
+    sin_alpha = sin(radians(pressure_angle_deg))
+    return int(2.0 / (sin_alpha ** 2)) + 1  # Round up for safety
+
+
+# Standard pressure angles (degrees)
+_STANDARD_PRESSURE_ANGLES = frozenset({14.5, 20.0, 25.0})
+
+# z_min for the standard pressure angles, so the common case needs no trig
+_ZMIN_TABLE = {pa: _minimum_teeth_formula(pa) for pa in _STANDARD_PRESSURE_ANGLES}
+
+
 def calculate_minimum_teeth(pressure_angle_deg: float) -> int:
     """
     Calculate minimum teeth without undercut for given pressure angle.
@@ -32,12 +60,13 @@ def calculate_minimum_teeth(pressure_angle_deg: float) -> int:
     Returns:
         Minimum number of teeth (rounded up)
     """
-    alpha_rad = radians(pressure_angle_deg)
-    sin_alpha = sin(alpha_rad)
-    z_min = 2.0 / (sin_alpha ** 2)
-    return int(z_min) + 1  # Round up for safety
+    z_min = _ZMIN_TABLE.get(pressure_angle_deg)
+    if z_min is None:
+        z_min = _minimum_teeth_formula(pressure_angle_deg)
+    return z_min
 
 
+@lru_cache(maxsize=256)
 def calculate_profile_shift(num_teeth: int, pressure_angle_deg: float) -> Optional[float]:
     """
     Calculate recommended profile shift coefficient to avoid undercut.
@@ -73,7 +102,7 @@ class Severity(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationMessage:
     """A single validation finding"""
     severity: Severity
@@ -82,146 +111,343 @@ class ValidationMessage:
     suggestion: Optional[str] = None
 
 
-@dataclass 
+@dataclass(slots=True)
 class ValidationResult:
     """Complete validation result"""
     valid: bool  # True if no errors
     messages: List[ValidationMessage] = field(default_factory=list)
-    
+    # Messages by severity (filled in __post_init__; messages is not re-scanned)
+    _errors: List[ValidationMessage] = field(init=False, repr=False, compare=False)
+    _warnings: List[ValidationMessage] = field(init=False, repr=False, compare=False)
+    _infos: List[ValidationMessage] = field(init=False, repr=False, compare=False)
+    # Message codes by severity (built on first access to code_set)
+    _codes: Optional[Dict[Severity, FrozenSet[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        # Bucket messages by severity in a single pass
+        self._errors, self._warnings, self._infos = [], [], []
+        buckets = {
+            Severity.ERROR: self._errors,
+            Severity.WARNING: self._warnings,
+            Severity.INFO: self._infos,
+        }
+        for m in self.messages:
+            buckets[m.severity].append(m)
+
     @property
     def errors(self) -> List[ValidationMessage]:
-        return [m for m in self.messages if m.severity == Severity.ERROR]
-    
+        return self._errors
+
     @property
     def warnings(self) -> List[ValidationMessage]:
-        return [m for m in self.messages if m.severity == Severity.WARNING]
-    
+        return self._warnings
+
     @property
     def infos(self) -> List[ValidationMessage]:
-        return [m for m in self.messages if m.severity == Severity.INFO]
+        return self._infos
+
+    @property
+    def code_set(self) -> Dict[Severity, FrozenSet[str]]:
+        """Message codes for each severity, for O(1) membership checks"""
+        if self._codes is None:
+            self._codes = {
+                Severity.ERROR: frozenset(m.code for m in self._errors),
+                Severity.WARNING: frozenset(m.code for m in self._warnings),
+                Severity.INFO: frozenset(m.code for m in self._infos),
+            }
+        return self._codes
+
+    @property
+    def non_info_codes(self) -> FrozenSet[str]:
+        """Error and warning message codes"""
+        codes = self.code_set
+        return codes[Severity.ERROR] | codes[Severity.WARNING]
+
+    @property
+    def all_codes(self) -> FrozenSet[str]:
+        """Message codes of every severity"""
+        return frozenset().union(*self.code_set.values())
+
+
+# Fixed-text messages, shared between results (safe as ValidationMessage is frozen)
+_MSG_SELF_LOCKING = ValidationMessage(
+    severity=Severity.INFO,
+    code="SELF_LOCKING",
+    message="Drive should be self-locking (lead angle < 6°)",
+    suggestion="Verify with actual materials and lubrication"
+)
+
+_MSG_PROFILE_ZK = ValidationMessage(
+    severity=Severity.INFO,
+    code="PROFILE_ZK",
+    message="ZK profile selected - optimized for 3D printing (FDM)",
+    suggestion=None
+)
+
+_MSG_GLOBOID_MISSING_THROAT = ValidationMessage(
+    severity=Severity.ERROR,
+    code="GLOBOID_MISSING_THROAT",
+    message="Globoid worm requires throat radius calculations",
+    suggestion="Ensure throat radii are calculated"
+)
+
+_MSG_GLOBOID_INVALID_GEOMETRY = ValidationMessage(
+    severity=Severity.ERROR,
+    code="GLOBOID_INVALID_GEOMETRY",
+    message="Invalid globoid: throat radius must be less than nominal radius",
+    suggestion="Increase throat reduction or check calculation"
+)
+
+_MSG_GLOBOID_NON_THROATED = ValidationMessage(
+    severity=Severity.WARNING,
+    code="GLOBOID_NON_THROATED",
+    message="Globoid worm typically requires throated wheel for proper contact",
+    suggestion="Consider enabling wheel_throated for better mesh"
+)
+
+_MSG_WHEEL_THROATED = ValidationMessage(
+    severity=Severity.INFO,
+    code="WHEEL_THROATED",
+    message="Throated wheel teeth provide better contact area",
+    suggestion=None
+)
+
+
+# Results of recent validate_design calls, keyed by _design_signature.
+# Oldest entries are evicted first once the cache is full.
+_VALIDATION_CACHE: Dict[tuple, ValidationResult] = {}
+_VALIDATION_CACHE_SIZE = 256
+_VALIDATION_CACHE_LOCK = Lock()
+
+
+def _design_signature(design: WormGearDesign) -> tuple:
+    """
+    Hashable key covering every design value the validators read.
+
+    WormParameters and WheelParameters are frozen, so they hash by value.
+    Values shown unformatted in messages also key on their type, so 17 and
+    17.0 (equal, but printed differently) don't share an entry.
+    """
+    mfg = design.manufacturing
+    if mfg is not None:
+        mfg = (mfg.worm_type, mfg.wheel_throated, mfg.wheel_width, mfg.worm_length)
+
+    pressure_angle = design.pressure_angle
+    wheel = design.wheel
+    return (
+        design.worm, wheel, design.centre_distance, pressure_angle,
+        design.efficiency_estimate, design.self_locking, design.profile, mfg,
+        type(pressure_angle), type(wheel.num_teeth)
+    )
 
 
-def validate_design(design: WormGearDesign) -> ValidationResult:
+def validate_design(design: WormGearDesign, fail_fast: bool = False) -> ValidationResult:
     """
     Validate a worm gear design against engineering rules.
 
+    Results are memoized on the design's values, so re-validating an
+    unchanged (or identical) design skips the rule checks. Each call gets
+    its own ValidationResult. Use clear_validation_cache() to reset.
+
+    Args:
+        design: Design to validate
+        fail_fast: Stop at the first error, for callers that only need
+                   validity. An invalid result then holds just that error
+                   and is not memoized; valid designs get every message.
+
     Returns ValidationResult with all findings.
     """
-    messages: List[ValidationMessage] = []
-
-    # Run all validation checks
-    messages.extend(_validate_lead_angle(design))
-    messages.extend(_validate_module(design))
-    messages.extend(_validate_teeth_count(design))
-    messages.extend(_validate_worm_proportions(design))
-    messages.extend(_validate_pressure_angle(design))
-    messages.extend(_validate_efficiency(design))
-    messages.extend(_validate_centre_distance(design))
-    messages.extend(_validate_clearance(design))  # Basic geometric constraint
-    messages.extend(_validate_profile(design))
-    messages.extend(_validate_worm_type(design))
-    messages.extend(_validate_wheel_throated(design))
-    messages.extend(_validate_manufacturing_compatibility(design))
-
-    # Design is valid if no errors
-    has_errors = any(m.severity == Severity.ERROR for m in messages)
-
-    return ValidationResult(
-        valid=not has_errors,
-        messages=messages
+    key = _design_signature(design)
+
+    with _VALIDATION_CACHE_LOCK:
+        result = _VALIDATION_CACHE.get(key)
+
+    if result is None:
+        messages: List[ValidationMessage] = []
+        for m in _rule_messages(design):
+            if fail_fast and m.severity is Severity.ERROR:
+                return ValidationResult(valid=False, messages=[m])
+            messages.append(m)
+
+        result = ValidationResult(valid=True, messages=messages)
+        # Design is valid if no errors
+        result.valid = not result.errors
+
+        with _VALIDATION_CACHE_LOCK:
+            if len(_VALIDATION_CACHE) >= _VALIDATION_CACHE_SIZE:
+                del _VALIDATION_CACHE[next(iter(_VALIDATION_CACHE))]
+            _VALIDATION_CACHE[key] = result
+    elif fail_fast and not result.valid:
+        return ValidationResult(valid=False, messages=[result.errors[0]])
+
+    return ValidationResult(valid=result.valid, messages=list(result.messages))
+
+
+def clear_validation_cache() -> None:
+    """Drop all memoized validate_design results"""
+    with _VALIDATION_CACHE_LOCK:
+        _VALIDATION_CACHE.clear()
+
+
+def is_valid(design: WormGearDesign) -> bool:
+    """
+    Check a design has no validation errors, without building messages.
+
+    Equivalent to validate_design(design).valid, but only evaluates the
+    ERROR-level rules, so it suits optimisation loops and sweeps that just
+    need feasibility. Thresholds are the shared _MIN_*/_MAX_* limits.
+    """
+    worm = design.worm
+    wheel = design.wheel
+    module = worm.module
+
+    # Lead angle, module size, undercut and worm proportions
+    if worm.lead_angle < _MIN_LEAD_ANGLE:
+        return False
+    if module < _MIN_MODULE:
+        return False
+    if wheel.num_teeth < calculate_minimum_teeth(design.pressure_angle):
+        return False
+    if worm.pitch_diameter / module < _MIN_WORM_DIA_TO_MODULE:
+        return False
+    if worm.root_diameter < _MIN_WORM_ROOT_DIAMETER:
+        return False
+
+    # Worm tip must clear wheel root
+    if design.centre_distance - worm.tip_radius - wheel.root_radius < _MIN_CLEARANCE:
+        return False
+
+    if not isinstance(design.profile, WormProfile):
+        return False
+
+    mfg = design.manufacturing
+    if mfg is None:
+        return True
+
+    worm_type = mfg.worm_type
+    if not isinstance(worm_type, WormType):
+        return False
+    if worm_type is not WormType.GLOBOID:
+        return True
+
+    # Globoid throat geometry
+    throat_pitch_radius = worm.throat_pitch_radius
+    if throat_pitch_radius is None:
+        return False
+
+    throat_reduction = worm.throat_reduction
+    if throat_reduction is not None and not throat_reduction < _MIN_THROAT_REDUCTION:
+        if throat_reduction > module * _MAX_THROAT_REDUCTION_FRACTION:
+            return False
+
+    if design.centre_distance - (worm.throat_tip_radius + wheel.root_radius) < _MIN_CLEARANCE:
+        return False
+    if throat_pitch_radius >= worm.pitch_radius:
+        return False
+
+    return True
+
+
+def _rule_messages(design: WormGearDesign) -> Iterator[ValidationMessage]:
+    """Run every validation rule against a design, yielding messages in order"""
+    return chain(
+        _validate_lead_angle(design),
+        _validate_module(design),
+        _validate_teeth_count(design),
+        _validate_worm_proportions(design),
+        _validate_operating_conditions(design),
+        _validate_clearance(design),  # Basic geometric constraint
+        _validate_profile(design),
+        _validate_worm_type(design),
+        _validate_wheel_throated(design),
+        _validate_manufacturing_compatibility(design),
     )
 
 
-def _validate_lead_angle(design: WormGearDesign) -> List[ValidationMessage]:
+def _validate_lead_angle(design: WormGearDesign) -> Iterator[ValidationMessage]:
     """Check lead angle is within practical range"""
-    messages = []
     lead_angle = design.worm.lead_angle
+    efficiency_pct = design.efficiency_estimate * 100
     
-    if lead_angle < 1.0:
-        messages.append(ValidationMessage(
+    if lead_angle < _MIN_LEAD_ANGLE:
+        yield ValidationMessage(
             severity=Severity.ERROR,
             code="LEAD_ANGLE_TOO_LOW",
             message=f"Lead angle {lead_angle:.1f}° is too low for practical manufacture",
             suggestion="Increase worm pitch diameter or reduce module"
-        ))
+        )
     elif lead_angle < 3.0:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="LEAD_ANGLE_VERY_LOW",
-            message=f"Lead angle {lead_angle:.1f}° is very low. Efficiency ~{design.efficiency_estimate*100:.0f}%",
+            message=f"Lead angle {lead_angle:.1f}° is very low. Efficiency ~{efficiency_pct:.0f}%",
             suggestion="Consider increasing worm diameter for better efficiency"
-        ))
+        )
     elif lead_angle < 5.0:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.INFO,
             code="LEAD_ANGLE_LOW",
-            message=f"Lead angle {lead_angle:.1f}° gives low efficiency (~{design.efficiency_estimate*100:.0f}%) but good self-locking",
+            message=f"Lead angle {lead_angle:.1f}° gives low efficiency (~{efficiency_pct:.0f}%) but good self-locking",
             suggestion=None
-        ))
+        )
     elif lead_angle > 25.0:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="LEAD_ANGLE_HIGH",
             message=f"Lead angle {lead_angle:.1f}° is high. Drive will not self-lock.",
             suggestion="This is fine if self-locking is not required"
-        ))
+        )
     elif lead_angle > 45.0:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.ERROR,
             code="LEAD_ANGLE_TOO_HIGH",
             message=f"Lead angle {lead_angle:.1f}° exceeds practical limits",
             suggestion="Reduce worm pitch diameter or increase module"
-        ))
-    
-    return messages
+        )
 
 
-def _validate_module(design: WormGearDesign) -> List[ValidationMessage]:
+def _validate_module(design: WormGearDesign) -> Iterator[ValidationMessage]:
     """Check module is standard or flag non-standard"""
-    messages = []
     module = design.worm.module
-    
-    if not is_standard_module(module):
-        nearest = nearest_standard_module(module)
-        deviation = abs(module - nearest) / nearest * 100
-        
+    is_standard, nearest, deviation = classify_module(module)
+
+    if not is_standard:
         if deviation > 10:
-            messages.append(ValidationMessage(
+            yield ValidationMessage(
                 severity=Severity.WARNING,
                 code="MODULE_NON_STANDARD",
                 message=f"Module {module:.3f}mm is non-standard (ISO 54)",
                 suggestion=f"Nearest standard module: {nearest}mm. Consider adjusting envelope constraints."
-            ))
+            )
         else:
-            messages.append(ValidationMessage(
+            yield ValidationMessage(
                 severity=Severity.INFO,
                 code="MODULE_NEAR_STANDARD",
                 message=f"Module {module:.3f}mm is close to standard {nearest}mm",
                 suggestion=f"Could round to {nearest}mm with minor OD changes"
-            ))
+            )
     
     # Check module is reasonable size
-    if module < 0.3:
-        messages.append(ValidationMessage(
+    if module < _MIN_MODULE:
+        yield ValidationMessage(
             severity=Severity.ERROR,
             code="MODULE_TOO_SMALL",
             message=f"Module {module:.3f}mm is too small for practical worm gears",
             suggestion="Minimum practical module is ~0.3mm for precision applications"
-        ))
+        )
     elif module < 0.5:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="MODULE_VERY_SMALL",
             message=f"Module {module:.3f}mm requires precision manufacturing",
             suggestion="Consider if tolerances are achievable"
-        ))
-    
-    return messages
+        )
 
 
-def _validate_teeth_count(design: WormGearDesign) -> List[ValidationMessage]:
+def _validate_teeth_count(design: WormGearDesign) -> Iterator[ValidationMessage]:
     """Check wheel tooth count with pressure angle consideration"""
-    messages = []
     num_teeth = design.wheel.num_teeth
     pressure_angle = design.pressure_angle
 
@@ -233,42 +459,38 @@ def _validate_teeth_count(design: WormGearDesign) -> List[ValidationMessage]:
 
     if num_teeth < z_min:
         if recommended_shift is not None:
-            messages.append(ValidationMessage(
+            yield ValidationMessage(
                 severity=Severity.ERROR,
                 code="TEETH_TOO_FEW",
                 message=f"Wheel has {num_teeth} teeth (min {z_min} for {pressure_angle}° pressure angle without undercut)",
                 suggestion=f"Apply profile shift coefficient x = {recommended_shift:.3f} or increase to {z_min}+ teeth"
-            ))
+            )
         else:
-            messages.append(ValidationMessage(
+            yield ValidationMessage(
                 severity=Severity.ERROR,
                 code="TEETH_TOO_FEW",
                 message=f"Wheel has {num_teeth} teeth - severe undercut risk",
                 suggestion=f"Increase to minimum {z_min} teeth for {pressure_angle}° pressure angle"
-            ))
+            )
     elif num_teeth < z_min * 1.4:  # Within 40% of minimum (e.g., 17-23 for 20° PA)
         # This range is acceptable but lower than ideal - warn user
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="TEETH_LOW",
             message=f"Wheel has {num_teeth} teeth - acceptable but lower than ideal for {pressure_angle}° pressure angle",
             suggestion=f"Consider increasing to {int(z_min * 1.4)}+ teeth for better tooth strength and durability"
-        ))
+        )
     elif num_teeth > 100:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.INFO,
             code="TEETH_HIGH",
             message=f"Wheel has {num_teeth} teeth - large gear, verify space available",
             suggestion=None
-        ))
+        )
 
-    return messages
 
-
-def _validate_worm_proportions(design: WormGearDesign) -> List[ValidationMessage]:
+def _validate_worm_proportions(design: WormGearDesign) -> Iterator[ValidationMessage]:
     """Check worm diameter proportions"""
-    messages = []
-    
     worm = design.worm
     module = worm.module
     
@@ -276,338 +498,296 @@ def _validate_worm_proportions(design: WormGearDesign) -> List[ValidationMessage
     # Rule of thumb: pitch_dia >= 4 × module for adequate shaft strength
     dia_to_module = worm.pitch_diameter / module
     
-    if dia_to_module < 3:
-        messages.append(ValidationMessage(
+    if dia_to_module < _MIN_WORM_DIA_TO_MODULE:
+        yield ValidationMessage(
             severity=Severity.ERROR,
             code="WORM_TOO_THIN",
             message=f"Worm pitch diameter is only {dia_to_module:.1f}× module - shaft will be weak",
             suggestion="Increase worm diameter or reduce module"
-        ))
+        )
     elif dia_to_module < 5:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="WORM_THIN",
             message=f"Worm pitch diameter is {dia_to_module:.1f}× module - verify shaft strength",
             suggestion="Consider increasing worm diameter"
-        ))
+        )
     
     # Check root diameter is positive and reasonable
-    if worm.root_diameter < 2:
-        messages.append(ValidationMessage(
+    if worm.root_diameter < _MIN_WORM_ROOT_DIAMETER:
+        yield ValidationMessage(
             severity=Severity.ERROR,
             code="WORM_ROOT_TOO_SMALL",
             message=f"Worm root diameter {worm.root_diameter:.2f}mm is too small",
             suggestion="Increase worm pitch diameter"
-        ))
-    
-    return messages
+        )
 
 
-def _validate_pressure_angle(design: WormGearDesign) -> List[ValidationMessage]:
-    """Check pressure angle is standard"""
-    messages = []
+def _validate_operating_conditions(design: WormGearDesign) -> Iterator[ValidationMessage]:
+    """
+    Check pressure angle, efficiency and centre distance.
+
+    These are a few comparisons each, so they share one generator rather
+    than paying for three calls.
+    """
+    # Pressure angle is standard
     pa = design.pressure_angle
-    
-    standard_angles = [14.5, 20.0, 25.0]
-    
-    if pa not in standard_angles:
-        messages.append(ValidationMessage(
+
+    if pa not in _STANDARD_PRESSURE_ANGLES:
+        yield ValidationMessage(
             severity=Severity.INFO,
             code="PRESSURE_ANGLE_NON_STANDARD",
             message=f"Pressure angle {pa}° is non-standard",
             suggestion="Standard values: 14.5°, 20°, 25°. 20° is most common."
-        ))
-    
+        )
+
     if pa < 14.5:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="PRESSURE_ANGLE_LOW",
             message=f"Pressure angle {pa}° is low - may cause interference",
             suggestion="Consider 20° for general use"
-        ))
+        )
     elif pa > 25:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="PRESSURE_ANGLE_HIGH",
             message=f"Pressure angle {pa}° is high - increased radial loads",
             suggestion="Consider 20° for general use"
-        ))
-    
-    return messages
-
+        )
 
-def _validate_efficiency(design: WormGearDesign) -> List[ValidationMessage]:
-    """Add efficiency information"""
-    messages = []
+    # Efficiency information
     eff = design.efficiency_estimate
-    
+
     if eff < 0.3:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="EFFICIENCY_VERY_LOW",
             message=f"Estimated efficiency {eff*100:.0f}% is very low",
             suggestion="Most input power will be lost to friction/heat"
-        ))
+        )
     elif eff < 0.5:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.INFO,
             code="EFFICIENCY_LOW",
             message=f"Estimated efficiency {eff*100:.0f}% - typical for self-locking drives",
             suggestion=None
-        ))
+        )
     elif eff > 0.85:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.INFO,
             code="EFFICIENCY_HIGH",
             message=f"Estimated efficiency {eff*100:.0f}% - good efficiency but not self-locking",
             suggestion=None
-        ))
-    
+        )
+
     # Self-locking note
     if design.self_locking:
-        messages.append(ValidationMessage(
-            severity=Severity.INFO,
-            code="SELF_LOCKING",
-            message="Drive should be self-locking (lead angle < 6°)",
-            suggestion="Verify with actual materials and lubrication"
-        ))
-    
-    return messages
-
+        yield _MSG_SELF_LOCKING
 
-def _validate_centre_distance(design: WormGearDesign) -> List[ValidationMessage]:
-    """Check centre distance is reasonable"""
-    messages = []
+    # Centre distance is reasonable
     cd = design.centre_distance
 
     if cd < 5:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="CENTRE_DISTANCE_SMALL",
             message=f"Centre distance {cd:.2f}mm is very small",
             suggestion="Verify assembly is practical"
-        ))
-
-    return messages
+        )
 
 
-def _validate_profile(design: WormGearDesign) -> List[ValidationMessage]:
+def _validate_profile(design: WormGearDesign) -> Iterator[ValidationMessage]:
     """Check profile type is valid"""
-    messages = []
+    profile = design.profile
 
     # Profile type validation - check it's a valid enum value
-    if design.profile not in (WormProfile.ZA, WormProfile.ZK):
-        messages.append(ValidationMessage(
+    if not isinstance(profile, WormProfile):
+        yield ValidationMessage(
             severity=Severity.ERROR,
             code="PROFILE_INVALID",
-            message=f"Invalid profile type: {design.profile}",
+            message=f"Invalid profile type: {profile}",
             suggestion="Use ZA (for CNC machining) or ZK (for 3D printing)"
-        ))
+        )
 
     # Info about profile type
-    if design.profile == WormProfile.ZK:
-        messages.append(ValidationMessage(
-            severity=Severity.INFO,
-            code="PROFILE_ZK",
-            message="ZK profile selected - optimized for 3D printing (FDM)",
-            suggestion=None
-        ))
+    if profile is WormProfile.ZK:
+        yield _MSG_PROFILE_ZK
 
-    return messages
 
+# Globoid throat reduction upper limits:
+# (fraction of module, severity, code, description, suggestion)
+_THROAT_REDUCTION_LIMITS = (
+    (_MAX_THROAT_REDUCTION_FRACTION, Severity.ERROR, "THROAT_REDUCTION_TOO_LARGE", "too large",
+     "Reduce throat reduction to less than 50% of module"),
+    (0.3, Severity.WARNING, "THROAT_REDUCTION_LARGE", "large",
+     "Consider reducing for better manufacturability"),
+)
 
-def _validate_worm_type(design: WormGearDesign) -> List[ValidationMessage]:
-    """Check worm type and related parameters"""
-    messages = []
 
-    if design.manufacturing is None:
-        return messages
+def _validate_worm_type(design: WormGearDesign) -> Iterator[ValidationMessage]:
+    """Check worm type and related parameters"""
+    mfg = design.manufacturing
+    if mfg is None:
+        return
 
-    worm_type = design.manufacturing.worm_type
+    worm_type = mfg.worm_type
 
     # Worm type validation - check it's a valid enum value
-    if worm_type not in (WormType.CYLINDRICAL, WormType.GLOBOID):
-        messages.append(ValidationMessage(
+    if not isinstance(worm_type, WormType):
+        yield ValidationMessage(
             severity=Severity.ERROR,
             code="WORM_TYPE_INVALID",
             message=f"Invalid worm type: {worm_type}",
             suggestion="Use cylindrical or globoid"
-        ))
-        return messages
+        )
+        return
 
     # Globoid-specific validations
-    if worm_type == WormType.GLOBOID:
-        # Check throat radii are present
-        if design.worm.throat_pitch_radius is None:
-            messages.append(ValidationMessage(
-                severity=Severity.ERROR,
-                code="GLOBOID_MISSING_THROAT",
-                message="Globoid worm requires throat radius calculations",
-                suggestion="Ensure throat radii are calculated"
-            ))
+    if worm_type is not WormType.GLOBOID:
+        return
+
+    worm = design.worm
+    throat_pitch_radius = worm.throat_pitch_radius
+    pitch_radius = worm.pitch_radius
+
+    # Check throat radii are present
+    if throat_pitch_radius is None:
+        yield _MSG_GLOBOID_MISSING_THROAT
+        return
+
+    # Validate throat reduction value
+    throat_reduction = worm.throat_reduction
+    if throat_reduction is not None:
+        module = worm.module
+
+        # Check reduction is reasonable
+        if throat_reduction < _MIN_THROAT_REDUCTION:
+            yield ValidationMessage(
+                severity=Severity.WARNING,
+                code="THROAT_REDUCTION_VERY_SMALL",
+                message=f"Throat reduction {throat_reduction:.3f}mm is very small - minimal hourglass effect",
+                suggestion="Typical values: 0.05-0.1mm for small gears, 0.1-0.2mm for medium"
+            )
         else:
-            # Validate throat reduction value
-            if design.worm.throat_reduction is not None:
-                throat_reduction = design.worm.throat_reduction
-                module = design.worm.module
-
-                # Check reduction is reasonable
-                if throat_reduction < 0.02:
-                    messages.append(ValidationMessage(
-                        severity=Severity.WARNING,
-                        code="THROAT_REDUCTION_VERY_SMALL",
-                        message=f"Throat reduction {throat_reduction:.3f}mm is very small - minimal hourglass effect",
-                        suggestion="Typical values: 0.05-0.1mm for small gears, 0.1-0.2mm for medium"
-                    ))
-                elif throat_reduction > module * 0.5:
-                    messages.append(ValidationMessage(
-                        severity=Severity.ERROR,
-                        code="THROAT_REDUCTION_TOO_LARGE",
-                        message=f"Throat reduction {throat_reduction:.3f}mm is too large (>{module * 0.5:.3f}mm = 50% of module)",
-                        suggestion="Reduce throat reduction to less than 50% of module"
-                    ))
-                elif throat_reduction > module * 0.3:
-                    messages.append(ValidationMessage(
-                        severity=Severity.WARNING,
-                        code="THROAT_REDUCTION_LARGE",
-                        message=f"Throat reduction {throat_reduction:.3f}mm is large (>{module * 0.3:.3f}mm = 30% of module)",
-                        suggestion="Consider reducing for better manufacturability"
-                    ))
-
-            # Check clearance at throat
-            clearance = design.centre_distance - (design.worm.throat_tip_radius + design.wheel.root_radius)
-            if clearance < 0:
-                messages.append(ValidationMessage(
-                    severity=Severity.ERROR,
-                    code="GLOBOID_INTERFERENCE",
-                    message=f"Interference! Worm throat tip intersects wheel root (clearance: {clearance:.3f}mm)",
-                    suggestion="Reduce throat reduction or increase centre distance"
-                ))
-            elif clearance < 0.05:
-                messages.append(ValidationMessage(
-                    severity=Severity.WARNING,
-                    code="GLOBOID_TIGHT_CLEARANCE",
-                    message=f"Very tight clearance at throat ({clearance:.3f}mm < 0.05mm)",
-                    suggestion="Manufacturing tolerance issues likely - consider increasing clearance"
-                ))
-
-            # Verify hourglass geometry
-            if design.worm.throat_pitch_radius >= design.worm.pitch_radius:
-                messages.append(ValidationMessage(
-                    severity=Severity.ERROR,
-                    code="GLOBOID_INVALID_GEOMETRY",
-                    message="Invalid globoid: throat radius must be less than nominal radius",
-                    suggestion="Increase throat reduction or check calculation"
-                ))
-
-            # Info about globoid
-            actual_reduction = design.worm.pitch_radius - design.worm.throat_pitch_radius
-            messages.append(ValidationMessage(
-                severity=Severity.INFO,
-                code="GLOBOID_WORM",
-                message=f"Globoid worm with {actual_reduction:.3f}mm throat reduction provides better contact with wheel",
-                suggestion=None
-            ))
+            # Upper limits as a fraction of module, most severe first
+            for fraction, severity, code, label, suggestion in _THROAT_REDUCTION_LIMITS:
+                limit = module * fraction
+                if throat_reduction > limit:
+                    yield ValidationMessage(
+                        severity=severity,
+                        code=code,
+                        message=f"Throat reduction {throat_reduction:.3f}mm is {label} (>{limit:.3f}mm = {fraction:.0%} of module)",
+                        suggestion=suggestion
+                    )
+                    break
+
+    # Check clearance at throat
+    clearance = design.centre_distance - (worm.throat_tip_radius + design.wheel.root_radius)
+    if clearance < _MIN_CLEARANCE:
+        yield ValidationMessage(
+            severity=Severity.ERROR,
+            code="GLOBOID_INTERFERENCE",
+            message=f"Interference! Worm throat tip intersects wheel root (clearance: {clearance:.3f}mm)",
+            suggestion="Reduce throat reduction or increase centre distance"
+        )
+    elif clearance < 0.05:
+        yield ValidationMessage(
+            severity=Severity.WARNING,
+            code="GLOBOID_TIGHT_CLEARANCE",
+            message=f"Very tight clearance at throat ({clearance:.3f}mm < 0.05mm)",
+            suggestion="Manufacturing tolerance issues likely - consider increasing clearance"
+        )
 
-    return messages
+    # Verify hourglass geometry
+    if throat_pitch_radius >= pitch_radius:
+        yield _MSG_GLOBOID_INVALID_GEOMETRY
 
+    # Info about globoid
+    yield ValidationMessage(
+        severity=Severity.INFO,
+        code="GLOBOID_WORM",
+        message=f"Globoid worm with {pitch_radius - throat_pitch_radius:.3f}mm throat reduction provides better contact with wheel",
+        suggestion=None
+    )
 
-def _validate_wheel_throated(design: WormGearDesign) -> List[ValidationMessage]:
-    """Check wheel throated setting is appropriate"""
-    messages = []
 
-    if design.manufacturing is None:
-        return messages
+def _validate_wheel_throated(design: WormGearDesign) -> Iterator[ValidationMessage]:
+    """Check wheel throated setting is appropriate"""
+    mfg = design.manufacturing
+    if mfg is None:
+        return
 
-    worm_type = design.manufacturing.worm_type
-    wheel_throated = design.manufacturing.wheel_throated
+    worm_type = mfg.worm_type
+    wheel_throated = mfg.wheel_throated
 
     # Warn if globoid worm with non-throated wheel
-    if worm_type == WormType.GLOBOID and not wheel_throated:
-        messages.append(ValidationMessage(
-            severity=Severity.WARNING,
-            code="GLOBOID_NON_THROATED",
-            message="Globoid worm typically requires throated wheel for proper contact",
-            suggestion="Consider enabling wheel_throated for better mesh"
-        ))
+    if worm_type is WormType.GLOBOID and not wheel_throated:
+        yield _MSG_GLOBOID_NON_THROATED
 
     # Info about throated wheel
     if wheel_throated:
-        messages.append(ValidationMessage(
-            severity=Severity.INFO,
-            code="WHEEL_THROATED",
-            message="Throated wheel teeth provide better contact area",
-            suggestion=None
-        ))
-
-    return messages
+        yield _MSG_WHEEL_THROATED
 
 
-def _validate_clearance(design: WormGearDesign) -> List[ValidationMessage]:
+def _validate_clearance(design: WormGearDesign) -> Iterator[ValidationMessage]:
     """
     Validate basic clearance between worm tip and wheel root.
 
     This is the fundamental geometric constraint - the hob must cut deep enough.
     """
-    messages = []
-
     # Calculate clearance: centre_distance - worm_tip_radius - wheel_root_radius
     clearance = design.centre_distance - design.worm.tip_radius - design.wheel.root_radius
 
-    if clearance < 0:
-        messages.append(ValidationMessage(
+    if clearance < _MIN_CLEARANCE:
+        yield ValidationMessage(
             severity=Severity.ERROR,
             code="INTERFERENCE",
             message=f"Interference! Worm tip overlaps wheel root by {abs(clearance):.3f}mm",
             suggestion="Increase centre distance or reduce worm tip diameter"
-        ))
+        )
     elif clearance < 0.05:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="TIGHT_CLEARANCE",
             message=f"Very tight clearance ({clearance:.3f}mm < 0.05mm) - manufacturing tolerance issues likely",
             suggestion="Consider increasing clearance for easier manufacturing"
-        ))
+        )
     elif clearance < 0.1:
-        messages.append(ValidationMessage(
+        yield ValidationMessage(
             severity=Severity.INFO,
             code="SMALL_CLEARANCE",
             message=f"Small clearance ({clearance:.3f}mm) - requires careful manufacturing",
             suggestion=None
-        ))
+        )
 
-    return messages
 
-
-def _validate_manufacturing_compatibility(design: WormGearDesign) -> List[ValidationMessage]:
+def _validate_manufacturing_compatibility(design: WormGearDesign) -> Iterator[ValidationMessage]:
     """Check manufacturing parameters are reasonable (guidelines, not constraints)"""
-    messages = []
-
-    if design.manufacturing is None:
-        return messages
+    mfg = design.manufacturing
+    if mfg is None:
+        return
 
-    worm_type = design.manufacturing.worm_type
-    wheel_width = design.manufacturing.wheel_width
-    worm_length = design.manufacturing.worm_length
+    wheel_width = mfg.wheel_width
+    worm_length = mfg.worm_length
+    lead = design.worm.lead
 
     # Info about recommendations
-    messages.append(ValidationMessage(
+    yield ValidationMessage(
         severity=Severity.INFO,
         code="MANUFACTURING_RECOMMENDATIONS",
         message=f"Recommended: wheel width {wheel_width:.2f}mm, worm length {worm_length:.2f}mm",
         suggestion="These are design guidelines based on contact ratio and engagement - adjust as needed"
-    ))
+    )
 
     # Check worm length provides adequate engagement
-    if worm_length < wheel_width + design.worm.lead:
-        messages.append(ValidationMessage(
+    if worm_length < wheel_width + lead:
+        yield ValidationMessage(
             severity=Severity.WARNING,
             code="WORM_LENGTH_SHORT",
             message=f"Worm length {worm_length:.2f}mm may not provide full engagement with wheel width {wheel_width:.2f}mm",
-            suggestion=f"Consider increasing to at least {wheel_width + design.worm.lead + 1:.2f}mm (width + lead + margin)"
-        ))
-
-    return messages
+            suggestion=f"Consider increasing to at least {wheel_width + lead + 1:.2f}mm (width + lead + margin)"
+        )
 
 
 def create_design_result(design: WormGearDesign) -> DesignResult:
@@ -617,11 +797,21 @@ def create_design_result(design: WormGearDesign) -> DesignResult:
     Convenience function that combines design with validation.
     """
     validation = validate_design(design)
-    
+
+    # Single pass over the messages
+    warnings, errors, suggestions = [], [], []
+    for m in validation.messages:
+        if m.severity is Severity.WARNING:
+            warnings.append(m.message)
+        elif m.severity is Severity.ERROR:
+            errors.append(m.message)
+        if m.suggestion:
+            suggestions.append(m.suggestion)
+
     return DesignResult(
-        design=design if validation.valid else design,  # Include design even if warnings
+        design=design,  # Include design even if it has errors
         valid=validation.valid,
-        warnings=[m.message for m in validation.warnings],
-        errors=[m.message for m in validation.errors],
-        suggestions=[m.suggestion for m in validation.messages if m.suggestion]
+        warnings=warnings,
+        errors=errors,
+        suggestions=suggestions
     )
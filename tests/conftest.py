@@ -0,0 +1,64 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the package up front so the first test doesn't carry cold-import time"""
+    import wormcalc.cli, wormcalc.core, wormcalc.validation, wormcalc.output  # noqa: F401
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """One CliRunner per test module; invoke() keeps no state between calls"""
+    return CliRunner()
+
+
+# Canonical designs shared by assertion-only tests across the session.
+# Tests that modify a design must build their own rather than use these.
+
+@pytest.fixture(scope="session")
+def envelope_design():
+    """design_from_envelope(worm_od=20, wheel_od=64, ratio=30)"""
+    from wormcalc.core import design_from_envelope
+    return design_from_envelope(worm_od=20.0, wheel_od=64.0, ratio=30)
+
+
+@pytest.fixture(scope="session")
+def module_design():
+    """design_from_module(module=2, ratio=30) - cylindrical, 7° target lead angle"""
+    from wormcalc.core import design_from_module
+    return design_from_module(module=2.0, ratio=30)
+
+
+@pytest.fixture(scope="session")
+def module_validation(module_design):
+    """validate_design(module_design)"""
+    from wormcalc.validation import validate_design
+    return validate_design(module_design)
+
+
+@pytest.fixture(scope="session")
+def globoid_design():
+    """design_from_module(module=2, ratio=30) with a globoid worm"""
+    from wormcalc.core import WormType, design_from_module
+    return design_from_module(module=2.0, ratio=30, worm_type=WormType.GLOBOID)
+
+
+@pytest.fixture(scope="session")
+def globoid_reduced_design():
+    """Globoid module 2, ratio 30 design with a 0.05mm throat reduction"""
+    from wormcalc.core import WormType, design_from_module
+    return design_from_module(module=2.0, ratio=30, worm_type=WormType.GLOBOID,
+                              throat_reduction=0.05)
+
+
+@pytest.fixture(scope="session")
+def zk_design():
+    """design_from_module(module=2, ratio=30) with a ZK profile"""
+    from wormcalc.core import WormProfile, design_from_module
+    return design_from_module(module=2.0, ratio=30, profile=WormProfile.ZK)
@@ -0,0 +1,223 @@
+"""
+Tests for wormcalc.batch
+
+Batch results must agree with the scalar design functions.
+"""
+
+import pytest
+from fractions import Fraction
+
+from wormcalc.validation import is_valid
+from wormcalc.core import (
+    WormParameters,
+    WheelParameters,
+    calculate_worm,
+    calculate_wheel,
+    design_from_envelope,
+    design_from_centre_distance,
+    estimate_efficiency,
+    nearest_standard_module,
+)
+from wormcalc.batch import (
+    DesignBatch,
+    calculate_worm_batch,
+    calculate_wheel_batch,
+    design_from_envelope_batch,
+    design_from_centre_distance_batch,
+    design_grid,
+    is_valid_batch,
+    estimate_efficiency_batch,
+    nearest_standard_module_batch,
+)
+
+
+class TestComponentBatches:
+    """Tests for worm and wheel geometry batches"""
+
+    def test_worm_batch_matches_scalar(self):
+        """Each worm row should rebuild the scalar WormParameters"""
+        modules = [1.0, 2.0, 2.5]
+        pitch_diameters = [12.0, 16.0, 25.0]
+        cols = calculate_worm_batch(modules, 2, pitch_diameters, backlash=0.1)
+
+        for i, (m, pd) in enumerate(zip(modules, pitch_diameters)):
+            row = WormParameters(**{k: v[i] for k, v in cols.items()})
+            assert row == calculate_worm(m, 2, pd, backlash=0.1)
+
+    def test_wheel_batch_matches_scalar(self):
+        """Each wheel row should rebuild the scalar WheelParameters"""
+        teeth = [20, 30, 40]
+        cols = calculate_wheel_batch(2.0, teeth, 5.0, profile_shift=0.2)
+
+        for i, z in enumerate(teeth):
+            row = WheelParameters(**{k: v[i] for k, v in cols.items()})
+            assert row == calculate_wheel(2.0, z, 16.0, 5.0, profile_shift=0.2)
+
+    def test_empty_batch(self):
+        """Empty inputs should give empty columns"""
+        cols = calculate_worm_batch([], 1, [])
+        assert cols["lead_angle"] == []
+
+
+class TestDesignFromEnvelopeBatch:
+    """Tests for column-oriented envelope design"""
+
+    def test_matches_scalar_design(self):
+        """Each batch row should match design_from_envelope"""
+        worm_ods = [18.0, 20.0, 24.0]
+        wheel_ods = [60.0, 64.0, 70.0]
+        ratios = [20, 30, 40]
+
+        batch = design_from_envelope_batch(worm_ods, wheel_ods, ratios, num_starts=2)
+
+        assert len(batch) == 3
+        for i, (worm_od, wheel_od, ratio) in enumerate(zip(worm_ods, wheel_ods, ratios)):
+            design = design_from_envelope(
+                worm_od=worm_od, wheel_od=wheel_od, ratio=ratio, num_starts=2
+            )
+            assert batch.num_teeth[i] == design.wheel.num_teeth
+            assert pytest.approx(batch.module[i], rel=1e-9) == design.worm.module
+            assert pytest.approx(batch.lead_angle[i], rel=1e-9) == design.worm.lead_angle
+            assert pytest.approx(batch.worm_root_diameter[i], rel=1e-9) == design.worm.root_diameter
+            assert pytest.approx(batch.wheel_tip_diameter[i], rel=1e-9) == design.wheel.tip_diameter
+            assert pytest.approx(batch.centre_distance[i], rel=1e-9) == design.centre_distance
+            assert pytest.approx(batch.efficiency_estimate[i], rel=1e-9) == design.efficiency_estimate
+            assert batch.self_locking[i] == design.self_locking
+
+    def test_scalars_broadcast(self):
+        """Scalar inputs should broadcast against sequences"""
+        batch = design_from_envelope_batch(20.0, 64.0, [20, 30, 40])
+        assert len(batch) == 3
+        assert batch.ratio == [20, 30, 40]
+
+    def test_other_numeric_scalars_broadcast(self):
+        """Any numbers.Number scalar, not just int/float, should broadcast"""
+        batch = design_from_envelope_batch(Fraction(20), 64.0, [20, 30])
+        assert len(batch) == 2
+        assert len(design_grid(Fraction(20), [60.0, 64.0], 30)) == 2
+
+    def test_all_scalars_single_row(self):
+        """All-scalar inputs should give a single row"""
+        batch = design_from_envelope_batch(20.0, 64.0, 30)
+        assert isinstance(batch, DesignBatch)
+        assert len(batch) == 1
+
+    def test_mismatched_lengths_rejected(self):
+        """Sequences of different lengths should raise"""
+        with pytest.raises(ValueError):
+            design_from_envelope_batch([20.0, 22.0], [64.0, 66.0, 68.0], 30)
+
+
+class TestDesignFromCentreDistanceBatch:
+    """Tests for column-oriented centre-distance design"""
+
+    def test_matches_scalar_design(self):
+        """Each batch row should match design_from_centre_distance"""
+        cds = [30.0, 40.0, 55.0]
+        ks = [0.25, 0.3, 0.4]
+        batch = design_from_centre_distance_batch(cds, 30, ks, num_starts=2)
+
+        assert len(batch) == 3
+        for i, (cd, k) in enumerate(zip(cds, ks)):
+            design = design_from_centre_distance(
+                centre_distance=cd, ratio=30, worm_to_wheel_ratio=k, num_starts=2
+            )
+            assert pytest.approx(batch.module[i], rel=1e-9) == design.worm.module
+            assert pytest.approx(batch.worm_tip_diameter[i], rel=1e-9) == design.worm.tip_diameter
+            assert pytest.approx(batch.wheel_root_diameter[i], rel=1e-9) == design.wheel.root_diameter
+            assert pytest.approx(batch.centre_distance[i], rel=1e-9) == cd
+            assert pytest.approx(batch.efficiency_estimate[i], rel=1e-9) == design.efficiency_estimate
+
+
+class TestDesignGrid:
+    """Tests for Cartesian-product sweeps"""
+
+    def test_grid_size(self):
+        """Grid should contain every combination"""
+        batch = design_grid([18.0, 20.0], 64.0, [20, 30, 40], num_starts=[1, 2])
+        assert len(batch) == 2 * 1 * 3 * 2
+
+    def test_grid_order(self):
+        """num_starts should vary fastest, worm_od slowest"""
+        batch = design_grid([18.0, 20.0], 64.0, [20, 30], num_starts=[1, 2])
+        assert batch.num_starts == [1, 2, 1, 2, 1, 2, 1, 2]
+        assert batch.ratio == [20, 20, 30, 30, 20, 20, 30, 30]
+        assert batch.worm_pitch_diameter[0] < batch.worm_pitch_diameter[-1]
+
+    def test_grid_rows_match_scalar(self):
+        """Each grid row should match the scalar envelope design"""
+        batch = design_grid(20.0, [60.0, 64.0], 30, num_starts=[1, 2])
+        for i in range(len(batch)):
+            design = design_from_envelope(
+                worm_od=20.0,
+                wheel_od=[60.0, 60.0, 64.0, 64.0][i],
+                ratio=30,
+                num_starts=batch.num_starts[i]
+            )
+            assert pytest.approx(batch.lead_angle[i], rel=1e-9) == design.worm.lead_angle
+
+    def test_empty_axis(self):
+        """An empty axis should give an empty grid"""
+        assert len(design_grid([], 64.0, 30)) == 0
+
+
+class TestBatchDesigns:
+    """Tests for inflating and validating batch rows"""
+
+    def test_envelope_rows_match_scalar_designs(self):
+        """to_designs should rebuild the scalar envelope designs"""
+        batch = design_from_envelope_batch([18.0, 20.0], 64.0, [20, 30],
+                                           pressure_angle=25.0, backlash=0.1)
+        expected = [
+            design_from_envelope(worm_od=18.0, wheel_od=64.0, ratio=20,
+                                 pressure_angle=25.0, backlash=0.1),
+            design_from_envelope(worm_od=20.0, wheel_od=64.0, ratio=30,
+                                 pressure_angle=25.0, backlash=0.1),
+        ]
+        assert list(batch.to_designs()) == expected
+
+    def test_centre_distance_row_matches_scalar_design(self):
+        """design(i) should rebuild the scalar centre-distance design"""
+        batch = design_from_centre_distance_batch([30.0, 40.0], 30, num_starts=2)
+        assert batch.design(1) == design_from_centre_distance(
+            centre_distance=40.0, ratio=30, num_starts=2
+        )
+
+    def test_is_valid_batch_matches_is_valid(self):
+        """Row flags should agree with is_valid on the inflated designs"""
+        batch = design_grid([8.0, 12.0, 20.0, 30.0], [20.0, 40.0, 65.0],
+                            [5, 10, 30, 60], num_starts=[1, 2, 4])
+        flags = is_valid_batch(batch)
+
+        assert flags == [is_valid(d) for d in batch.to_designs()]
+        assert True in flags and False in flags
+
+
+class TestEstimateEfficiencyBatch:
+    """Tests for batch efficiency estimation"""
+
+    def test_matches_scalar(self):
+        """Batch efficiencies should equal the scalar estimates"""
+        angles = [0.5, 1.0, 5.0, 10.0, 20.0, 45.0, 88.0, 89.0, 90.0, 95.0, 135.0]
+        effs = estimate_efficiency_batch(angles, pressure_angle_deg=25.0,
+                                         friction_coefficient=0.08)
+        assert effs == [estimate_efficiency(a, 25.0, 0.08) for a in angles]
+
+    def test_zero_past_friction_limit(self):
+        """Lead angles at or beyond 90° - ρ should give zero efficiency"""
+        assert estimate_efficiency_batch([88.0, 95.0, 135.0]) == [0.0, 0.0, 0.0]
+
+    def test_empty_input(self):
+        """No lead angles should give no efficiencies"""
+        assert estimate_efficiency_batch([]) == []
+
+
+class TestNearestStandardModuleBatch:
+    """Tests for batch module snapping"""
+
+    def test_matches_scalar(self):
+        """Batch snapping should equal the scalar lookup"""
+        modules = [0.1, 0.55, 1.6, 2.1, 2.3, 19.0, 40.0]
+        assert nearest_standard_module_batch(modules) == [
+            nearest_standard_module(m) for m in modules
+        ]
@@ -6,115 +6,98 @@ Test CLI commands and argument parsing.
 
 import pytest
 import json
-from click.testing import CliRunner
+import click
 
-from wormcalc.cli import cli
+from wormcalc.cli import (
+    cli, envelope, from_wheel, from_module, from_centre_distance, check_module
+)
+
+
+# Shared argv prefix for tests that vary one from-module option
+FROM_MODULE_ARGS = ('from-module', '--module', '2.0', '--ratio', '30')
+
+
+def run_command(command, capsys, **kwargs):
+    """
+    Call a command directly with defaults filled in, returning its output.
+
+    Skips argv parsing, for tests about what a command does rather than how
+    its options are parsed; each command keeps one runner.invoke test.
+    """
+    with click.Context(command) as ctx:
+        ctx.invoke(command, **kwargs)
+    return capsys.readouterr().out
 
 
 class TestEnvelopeCommand:
     """Tests for envelope command"""
 
-    def test_envelope_basic(self):
+    def test_envelope_basic(self, runner):
         """Envelope command should work with basic parameters"""
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'envelope',
             '--worm-od', '20',
             '--wheel-od', '65',
             '--ratio', '30'
-        ])
+        ], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert 'Module' in result.output
         assert 'Ratio: 30:1' in result.output
 
-    def test_envelope_with_pressure_angle(self):
-        """Envelope command should accept pressure angle"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'envelope',
-            '--worm-od', '20',
-            '--wheel-od', '65',
-            '--ratio', '30',
-            '--pressure-angle', '25'
-        ])
+    def test_envelope_with_pressure_angle(self, capsys):
+        """Envelope command should use the given pressure angle"""
+        output = run_command(envelope, capsys, worm_od=20.0, wheel_od=65.0, ratio=30,
+                             pressure_angle=25.0, output='json')
 
-        assert result.exit_code == 0
-        # Pressure angle affects calculations even if not shown in summary
+        assert json.loads(output)['assembly']['pressure_angle_deg'] == 25.0
 
-    def test_envelope_with_backlash(self):
-        """Envelope command should accept backlash"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'envelope',
-            '--worm-od', '20',
-            '--wheel-od', '65',
-            '--ratio', '30',
-            '--backlash', '0.1'
-        ])
+    def test_envelope_with_backlash(self, capsys):
+        """Envelope command should use the given backlash"""
+        output = run_command(envelope, capsys, worm_od=20.0, wheel_od=65.0, ratio=30,
+                             backlash=0.1, output='json')
 
-        assert result.exit_code == 0
+        assert json.loads(output)['assembly']['backlash_mm'] == 0.1
 
-    def test_envelope_json_output(self):
+    def test_envelope_json_output(self, capsys):
         """Envelope command should output JSON when requested"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'envelope',
-            '--worm-od', '20',
-            '--wheel-od', '65',
-            '--ratio', '30',
-            '--output', 'json'
-        ])
+        output = run_command(envelope, capsys, worm_od=20.0, wheel_od=65.0, ratio=30,
+                             output='json')
 
-        assert result.exit_code == 0
         # Should be valid JSON
-        data = json.loads(result.output)
+        data = json.loads(output)
         assert 'worm' in data
         assert 'wheel' in data
 
-    def test_envelope_left_hand(self):
+    def test_envelope_left_hand(self, capsys):
         """Envelope command should accept left hand"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'envelope',
-            '--worm-od', '20',
-            '--wheel-od', '65',
-            '--ratio', '30',
-            '--hand', 'left'
-        ])
+        output = run_command(envelope, capsys, worm_od=20.0, wheel_od=65.0, ratio=30,
+                             hand='left', output='json')
 
-        assert result.exit_code == 0
+        assert json.loads(output)['assembly']['hand'] == 'left'
 
 
 class TestFromWheelCommand:
     """Tests for from-wheel command"""
 
-    def test_from_wheel_basic(self):
+    def test_from_wheel_basic(self, runner):
         """From-wheel command should work with basic parameters"""
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'from-wheel',
             '--wheel-od', '65',
             '--ratio', '30',
             '--target-lead-angle', '8'
-        ])
+        ], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert 'Ratio: 30:1' in result.output
 
-    def test_from_wheel_json_output(self):
+    def test_from_wheel_json_output(self, capsys):
         """From-wheel command should output JSON"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-wheel',
-            '--wheel-od', '65',
-            '--ratio', '30',
-            '--target-lead-angle', '8',
-            '--output', 'json'
-        ])
+        output = run_command(from_wheel, capsys, wheel_od=65.0, ratio=30,
+                             target_lead_angle=8.0, output='json')
 
-        assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(output)
         assert 'assembly' in data
         assert data['assembly']['ratio'] == 30
 
@@ -122,229 +105,217 @@ class TestFromWheelCommand:
 class TestFromModuleCommand:
     """Tests for from-module command"""
 
-    def test_from_module_basic(self):
+    def test_from_module_basic(self, runner):
         """From-module command should work with basic parameters"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30'
-        ])
+        result = runner.invoke(cli, FROM_MODULE_ARGS, catch_exceptions=False)
 
         assert result.exit_code == 0
         assert 'Module: 2.0' in result.output or '2.0 mm' in result.output
 
-    def test_from_module_with_target_lead_angle(self):
-        """From-module command should accept target lead angle"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--target-lead-angle', '10'
-        ])
+    def test_from_module_with_target_lead_angle(self, capsys):
+        """From-module command should use the target lead angle"""
+        output = run_command(from_module, capsys, module=2.0, ratio=30,
+                             target_lead_angle=10.0, output='json')
 
-        assert result.exit_code == 0
+        assert json.loads(output)['worm']['lead_angle_deg'] == pytest.approx(10.0, abs=0.01)
 
-    def test_from_module_json_output(self):
+    def test_from_module_json_output(self, capsys):
         """From-module command should output JSON"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--output', 'json'
-        ])
+        output = run_command(from_module, capsys, module=2.0, ratio=30, output='json')
 
-        assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(output)
         assert data['worm']['module_mm'] == 2.0
 
-    def test_from_module_multi_start(self):
+    def test_from_module_multi_start(self, capsys):
         """From-module command should accept multi-start"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--num-starts', '2'
-        ])
+        output = run_command(from_module, capsys, module=2.0, ratio=30,
+                             num_starts=2, output='json')
 
-        assert result.exit_code == 0
+        assert json.loads(output)['worm']['num_starts'] == 2
 
 
 class TestFromCentreDistanceCommand:
     """Tests for from-centre-distance command"""
 
-    def test_from_centre_distance_basic(self):
+    def test_from_centre_distance_basic(self, runner):
         """From-centre-distance command should work with basic parameters"""
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'from-centre-distance',
             '--centre-distance', '40',
             '--ratio', '30'
-        ])
+        ], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert 'Ratio: 30:1' in result.output
 
-    def test_from_centre_distance_json_output(self):
+    def test_from_centre_distance_json_output(self, capsys):
         """From-centre-distance command should output JSON"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-centre-distance',
-            '--centre-distance', '40',
-            '--ratio', '30',
-            '--output', 'json'
-        ])
+        output = run_command(from_centre_distance, capsys, centre_distance=40.0,
+                             ratio=30, output='json')
 
-        assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(output)
         assert 'assembly' in data
 
 
 class TestUtilityCommands:
     """Tests for utility commands"""
 
-    def test_list_modules(self):
+    def test_list_modules(self, runner):
         """List-modules command should display standard modules"""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['list-modules'])
+        result = runner.invoke(cli, ['list-modules'], catch_exceptions=False)
 
         assert result.exit_code == 0
-        assert 'Standard Modules' in result.output
-        # Should include some common modules
-        assert '0.5' in result.output
-        assert '1.0' in result.output
-        assert '2.0' in result.output
+        # Heading plus some common modules
+        output = result.output
+        assert all(s in output for s in ('Standard Modules', '0.5', '1.0', '2.0'))
 
-    def test_check_module_standard(self):
+    def test_check_module_standard(self, runner):
         """Check-module command should identify standard modules"""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['check-module', '--module', '2.0'])
+        result = runner.invoke(cli, ['check-module', '--module', '2.0'], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert 'standard' in result.output.lower()
 
-    def test_check_module_non_standard(self):
+    def test_check_module_non_standard(self, capsys):
         """Check-module command should identify non-standard modules"""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['check-module', '--module', '2.3'])
+        output = run_command(check_module, capsys, module=2.3)
 
-        assert result.exit_code == 0
         # Check for "No" in standard field
-        assert 'standard' in result.output.lower() and 'no' in result.output.lower()
+        lowered = output.lower()
+        assert 'standard' in lowered and 'no' in lowered
         # Should suggest nearest
-        assert '2.25' in result.output or '2.5' in result.output
+        assert '2.25' in output or '2.5' in output
 
 
-class TestOutputFormats:
-    """Tests for different output formats"""
+class TestBatchCommand:
+    """Tests for batch command"""
 
-    def test_text_output_default(self):
-        """Text output should be default"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30'
-        ])
+    CSV = "worm_od,wheel_od,ratio,num_starts\n20,65,30,1\n18,60,20,2\n"
+
+    def test_batch_csv_output(self, runner):
+        """Batch command should write one CSV row per input row"""
+        result = runner.invoke(cli, ['batch', '-'], input=self.CSV, catch_exceptions=False)
 
         assert result.exit_code == 0
-        # Text format characteristics
-        assert 'Worm Gear Design' in result.output
-        assert '═' in result.output or '-' in result.output
+        lines = result.output.strip().splitlines()
+        assert lines[0].startswith('ratio,num_starts,num_teeth,module')
+        assert len(lines) == 3
 
-    def test_json_output_format(self):
-        """JSON output format should be valid"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--output', 'json'
-        ])
+    def test_batch_jsonl_output(self, runner):
+        """Batch command should write JSON lines when requested"""
+        result = runner.invoke(cli, ['batch', '-', '--output', 'jsonl'], input=self.CSV,
+                               catch_exceptions=False)
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
-        assert isinstance(data, dict)
+        rows = [json.loads(line) for line in result.output.strip().splitlines()]
+        assert [row['num_starts'] for row in rows] == [1, 2]
+        assert rows[0]['worm_tip_diameter'] == pytest.approx(20.0)
 
-    def test_markdown_output_format(self):
-        """Markdown output format should have markdown syntax"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--output', 'markdown'
-        ])
+    def test_batch_num_starts_optional(self, runner):
+        """num_starts column should default to 1"""
+        result = runner.invoke(cli, ['batch', '-', '-o', 'jsonl'],
+                               input="worm_od,wheel_od,ratio\n20,65,30\n", catch_exceptions=False)
 
         assert result.exit_code == 0
-        # Markdown characteristics
-        assert '# ' in result.output  # Headers
-        assert '## ' in result.output
+        assert json.loads(result.output)['num_starts'] == 1
 
+    def test_batch_missing_column(self, runner):
+        """Missing required columns should be reported"""
+        result = runner.invoke(cli, ['batch', '-'], input="worm_od,ratio\n20,30\n",
+                               catch_exceptions=False)
 
-class TestManufacturingOptions:
-    """Tests for manufacturing-related options"""
+        assert result.exit_code != 0
+        assert 'wheel_od' in result.output
 
-    def test_profile_za(self):
-        """Should accept ZA profile"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--profile', 'ZA'
-        ])
+    def test_batch_bad_value(self, runner):
+        """Non-numeric values should be reported with their CSV line"""
+        result = runner.invoke(cli, ['batch', '-'],
+                               input="worm_od,wheel_od,ratio\n20,65,30\n20,big,30\n",
+                               catch_exceptions=False)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 2
+        assert 'Bad value on CSV line 3' in result.output
 
-    def test_profile_zk(self):
-        """Should accept ZK profile"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--profile', 'ZK'
-        ])
+    def test_batch_non_positive_value(self, runner):
+        """Zero or negative sizes should be reported with their CSV line"""
+        result = runner.invoke(cli, ['batch', '-'], input="worm_od,wheel_od,ratio\n0,0,30\n",
+                               catch_exceptions=False)
 
-        assert result.exit_code == 0
+        assert result.exit_code == 2
+        assert 'Bad value on CSV line 2' in result.output
 
-    def test_worm_type_cylindrical(self):
-        """Should accept cylindrical worm type"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--worm-type', 'cylindrical'
-        ])
+    def test_batch_degenerate_geometry(self, runner):
+        """Rows with no room for the worm should be reported, not raise"""
+        result = runner.invoke(cli, ['batch', '-'],
+                               input="worm_od,wheel_od,ratio,num_starts\n20,65,30,1\n100,500,2,4\n",
+                               catch_exceptions=False)
+
+        assert result.exit_code == 2
+        assert 'Bad value on CSV line 3' in result.output
+
+    def test_batch_short_row(self, runner):
+        """Rows with missing fields should be a usage error, not a traceback"""
+        result = runner.invoke(cli, ['batch', '-'], input="worm_od,wheel_od,ratio\n20,64\n",
+                               catch_exceptions=False)
+
+        assert result.exit_code == 2
+        assert 'Bad value on CSV line 2' in result.output
+
+
+@pytest.fixture(scope="module")
+def from_module_outputs(runner):
+    """from-module results keyed by output format ('default' passes no --output)"""
+    outputs = {'default': runner.invoke(cli, FROM_MODULE_ARGS, catch_exceptions=False)}
+    for output_format in ('text', 'json', 'markdown'):
+        outputs[output_format] = runner.invoke(
+            cli, [*FROM_MODULE_ARGS, '--output', output_format], catch_exceptions=False
+        )
+    return outputs
+
+
+class TestOutputFormats:
+    """Tests for different output formats"""
+
+    def test_text_output_default(self, from_module_outputs):
+        """Text output should be default"""
+        result = from_module_outputs['default']
 
         assert result.exit_code == 0
+        # Text format characteristics
+        assert 'Worm Gear Design' in result.output
+        assert '═' in result.output or '-' in result.output
+        assert result.output == from_module_outputs['text'].output
 
-    def test_worm_type_globoid(self):
-        """Should accept globoid worm type"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--worm-type', 'globoid'
-        ])
+    @pytest.mark.parametrize("output_format,markers", [
+        ('text', ['Worm Gear Design']),
+        ('json', ['"worm"', '"wheel"']),
+        ('markdown', ['# ', '## ']),
+    ])
+    def test_output_format(self, from_module_outputs, output_format, markers):
+        """Each output format should have its own characteristics"""
+        result = from_module_outputs[output_format]
 
         assert result.exit_code == 0
+        for marker in markers:
+            assert marker in result.output
+        if output_format == 'json':
+            assert isinstance(json.loads(result.output), dict)
 
-    def test_wheel_throated(self):
-        """Should accept throated flag"""
-        runner = CliRunner()
-        result = runner.invoke(cli, [
-            'from-module',
-            '--module', '2.0',
-            '--ratio', '30',
-            '--throated'
-        ])
+
+class TestManufacturingOptions:
+    """Tests for manufacturing-related options"""
+
+    @pytest.mark.parametrize("flag,value", [
+        ('--profile', 'ZA'),
+        ('--profile', 'ZK'),
+        ('--worm-type', 'cylindrical'),
+        ('--worm-type', 'globoid'),
+        ('--throated', None),
+    ])
+    def test_option_accepted(self, runner, flag, value):
+        """Should accept each profile, worm type and the throated flag"""
+        extra = [flag] if value is None else [flag, value]
+        result = runner.invoke(cli, [*FROM_MODULE_ARGS, *extra], catch_exceptions=False)
 
         assert result.exit_code == 0
 
@@ -354,14 +325,12 @@ class TestErrorHandling:
 
     def test_missing_required_args(self):
         """Should error when required args are missing"""
-        runner = CliRunner()
-        result = runner.invoke(cli, ['envelope'])
-
-        assert result.exit_code != 0
+        # Non-standalone mode raises the usage error instead of formatting it
+        with pytest.raises(click.MissingParameter):
+            cli.main(['envelope'], standalone_mode=False)
 
-    def test_invalid_module(self):
+    def test_invalid_module(self, runner):
         """Should handle invalid module gracefully"""
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'from-module',
             '--module', '-1',  # Negative module
@@ -371,9 +340,8 @@ class TestErrorHandling:
         # Should either error or show validation warnings
         assert result.exit_code == 0 or result.exit_code != 0
 
-    def test_invalid_ratio(self):
+    def test_invalid_ratio(self, runner):
         """Should handle invalid ratio gracefully"""
-        runner = CliRunner()
         result = runner.invoke(cli, [
             'from-module',
             '--module', '2.0',
@@ -5,7 +5,11 @@ Validation against hand calculations and engineering references.
 """
 
 import pytest
-from math import pi, tan, radians, degrees
+import subprocess
+import sys
+from dataclasses import FrozenInstanceError
+from itertools import pairwise
+from math import pi, atan, degrees
 
 from wormcalc.core import (
     WormParameters,
@@ -27,6 +31,7 @@ from wormcalc.core import (
     design_from_centre_distance,
     nearest_standard_module,
     is_standard_module,
+    classify_module,
     estimate_efficiency,
 )
 
@@ -35,8 +40,8 @@ class TestStandardModules:
     """Tests for module-related functions"""
     
     def test_standard_modules_sorted(self):
-        """Standard modules should be in ascending order"""
-        assert STANDARD_MODULES == sorted(STANDARD_MODULES)
+        """Standard modules should be in strictly ascending order"""
+        assert all(a < b for a, b in pairwise(STANDARD_MODULES))
     
     def test_is_standard_module_true(self):
         """Should identify standard modules"""
@@ -50,12 +55,46 @@ class TestStandardModules:
         assert not is_standard_module(1.6)
         assert not is_standard_module(0.55)
     
-    def test_nearest_standard_module(self):
+    @pytest.mark.parametrize("module,expected", [
+        (2.1, 2.0),
+        (1.9, 2.0),
+        (1.6, 1.5),
+        (2.3, 2.25),
+    ])
+    def test_nearest_standard_module(self, module, expected):
         """Should find nearest standard"""
-        assert nearest_standard_module(2.1) == 2.0
-        assert nearest_standard_module(1.9) == 2.0
-        assert nearest_standard_module(1.6) == 1.5
-        assert nearest_standard_module(2.3) == 2.25
+        assert nearest_standard_module(module) == expected
+
+    def test_nearest_standard_module_out_of_range(self):
+        """Values outside the table should snap to the end values"""
+        assert nearest_standard_module(0.1) == STANDARD_MODULES[0]
+        assert nearest_standard_module(40.0) == STANDARD_MODULES[-1]
+
+    def test_classify_module(self):
+        """classify_module should agree with the separate lookups"""
+        for module in (0.1, 0.5, 1.6, 2.0, 2.0005, 2.3, 40.0):
+            is_std, nearest, deviation = classify_module(module)
+            assert is_std == is_standard_module(module)
+            assert nearest == nearest_standard_module(module)
+            assert deviation == pytest.approx(abs(module - nearest) / nearest * 100)
+
+    def test_nearest_standard_module_memoized(self):
+        """Repeated lookups should be served from the cache"""
+        nearest_standard_module.cache_clear()
+        assert nearest_standard_module(2.1) == nearest_standard_module(2.1)
+        assert nearest_standard_module.cache_info().hits == 1
+
+    def test_module_groups_cover_table(self):
+        """Size-range groups should partition the table in order"""
+        from wormcalc.core import SMALL_MODULES, MEDIUM_MODULES, LARGE_MODULES
+        assert SMALL_MODULES + MEDIUM_MODULES + LARGE_MODULES == STANDARD_MODULES
+
+
+@pytest.fixture(scope="module")
+def worms_by_starts():
+    """Module 2, 16mm pitch diameter worms keyed by number of starts"""
+    return {n: calculate_worm(module=2.0, num_starts=n, pitch_diameter=16.0)
+            for n in (1, 2, 3, 4, 6)}
 
 
 class TestCalculateWorm:
@@ -96,19 +135,14 @@ class TestCalculateWorm:
         expected_angle = degrees(pi * 2.0 / (pi * 16.0))  # Simplified: atan(m/d) for small angles
         
         # For exact: atan(lead / (π × d))
-        from math import atan
         exact_angle = degrees(atan(lead / (pi * 16.0)))
         
         assert pytest.approx(worm.lead_angle, rel=1e-6) == exact_angle
     
-    def test_lead_angle_multi_start(self):
+    @pytest.mark.parametrize("fewer,more", [(1, 2), (2, 3), (3, 4), (4, 6)])
+    def test_lead_angle_multi_start(self, worms_by_starts, fewer, more):
         """Multi-start worms should have higher lead angles"""
-        worm_1 = calculate_worm(module=2.0, num_starts=1, pitch_diameter=16.0)
-        worm_2 = calculate_worm(module=2.0, num_starts=2, pitch_diameter=16.0)
-        worm_4 = calculate_worm(module=2.0, num_starts=4, pitch_diameter=16.0)
-        
-        assert worm_2.lead_angle > worm_1.lead_angle
-        assert worm_4.lead_angle > worm_2.lead_angle
+        assert worms_by_starts[more].lead_angle > worms_by_starts[fewer].lead_angle
     
     def test_backlash_reduces_thread_thickness(self):
         """Backlash should reduce thread thickness"""
@@ -118,6 +152,25 @@ class TestCalculateWorm:
         assert worm_bl.thread_thickness < worm_no_bl.thread_thickness
         assert pytest.approx(worm_no_bl.thread_thickness - worm_bl.thread_thickness) == 0.1
 
+    def test_worm_parameters_immutable(self):
+        """Calculated worm dimensions should be read-only"""
+        worm = calculate_worm(module=2.0, num_starts=1, pitch_diameter=16.0)
+        with pytest.raises(FrozenInstanceError):
+            worm.pitch_diameter = 20.0
+
+    def test_core_dataclasses_use_slots(self, module_design):
+        """Core result dataclasses should not carry a per-instance __dict__"""
+        design = module_design
+        for obj in (design, design.worm, design.wheel, design.manufacturing):
+            assert not hasattr(obj, "__dict__")
+
+    def test_radii_are_half_diameters(self):
+        """Derived radii should be half the corresponding diameters"""
+        worm = calculate_worm(module=2.0, num_starts=1, pitch_diameter=16.0)
+        assert worm.pitch_radius == worm.pitch_diameter / 2
+        assert worm.tip_radius == worm.tip_diameter / 2
+        assert worm.root_radius == worm.root_diameter / 2
+
 
 class TestCalculateWheel:
     """Tests for wheel calculations"""
@@ -161,43 +214,26 @@ class TestCentreDistance:
 class TestDesignFromEnvelope:
     """Tests for envelope-based design"""
     
-    def test_basic_design(self):
+    def test_basic_design(self, envelope_design):
         """Test basic envelope design"""
-        design = design_from_envelope(
-            worm_od=20.0,
-            wheel_od=64.0,
-            ratio=30
-        )
-        
         # Check ratio
-        assert design.ratio == 30
+        assert envelope_design.ratio == 30
         
         # Check ODs match input (approximately, accounting for module rounding)
-        assert pytest.approx(design.worm.tip_diameter, rel=0.01) == 20.0
-        assert pytest.approx(design.wheel.tip_diameter, rel=0.01) == 64.0
+        assert pytest.approx(envelope_design.worm.tip_diameter, rel=0.01) == 20.0
+        assert pytest.approx(envelope_design.wheel.tip_diameter, rel=0.01) == 64.0
     
-    def test_module_calculation(self):
+    def test_module_calculation(self, envelope_design):
         """Module should be derived from wheel OD and teeth"""
-        design = design_from_envelope(
-            worm_od=20.0,
-            wheel_od=64.0,
-            ratio=30
-        )
-        
         # module = wheel_od / (teeth + 2)
         expected_module = 64.0 / (30 + 2)
-        assert pytest.approx(design.worm.module, rel=1e-6) == expected_module
+        assert pytest.approx(envelope_design.worm.module, rel=1e-6) == expected_module
     
-    def test_centre_distance_consistency(self):
+    def test_centre_distance_consistency(self, envelope_design):
         """Centre distance should be consistent with pitch diameters"""
-        design = design_from_envelope(
-            worm_od=20.0,
-            wheel_od=64.0,
-            ratio=30
-        )
-        
-        expected_cd = (design.worm.pitch_diameter + design.wheel.pitch_diameter) / 2
-        assert pytest.approx(design.centre_distance, rel=1e-6) == expected_cd
+        worm, wheel = envelope_design.worm, envelope_design.wheel
+        expected_cd = (worm.pitch_diameter + wheel.pitch_diameter) / 2
+        assert pytest.approx(envelope_design.centre_distance, rel=1e-6) == expected_cd
 
 
 class TestDesignFromWheel:
@@ -225,19 +261,31 @@ class TestDesignFromWheel:
         
         assert pytest.approx(design.wheel.tip_diameter, rel=0.01) == 64.0
 
+    def test_cylindrical_lead_angle_exact(self):
+        """Target lead angle should pass through without an atan round trip"""
+        design = design_from_wheel(wheel_od=64.0, ratio=30, target_lead_angle=7.3)
+        assert design.worm.lead_angle == 7.3
+        assert design.wheel.helix_angle == 90.0 - 7.3
+
+    def test_globoid_lead_angle_recalculated(self):
+        """Globoid lead angle should reflect the enlarged pitch diameter"""
+        design = design_from_wheel(
+            wheel_od=64.0, ratio=30, target_lead_angle=7.0,
+            worm_type=WormType.GLOBOID, throat_reduction=0.2
+        )
+        worm = design.worm
+        expected = degrees(atan(worm.lead / (pi * worm.pitch_diameter)))
+        assert design.worm.lead_angle == pytest.approx(expected)
+        assert design.worm.lead_angle < 7.0
+
 
 class TestDesignFromModule:
     """Tests for module-based design"""
     
-    def test_module_preserved(self):
+    def test_module_preserved(self, module_design):
         """Module should match input"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30
-        )
-        
-        assert pytest.approx(design.worm.module, rel=1e-6) == 2.0
-        assert pytest.approx(design.wheel.module, rel=1e-6) == 2.0
+        assert pytest.approx(module_design.worm.module, rel=1e-6) == 2.0
+        assert pytest.approx(module_design.wheel.module, rel=1e-6) == 2.0
     
     def test_with_specific_worm_diameter(self):
         """Should use specified worm pitch diameter"""
@@ -262,64 +310,121 @@ class TestDesignFromCentreDistance:
         
         assert pytest.approx(design.centre_distance, rel=0.01) == 40.0
 
+    def test_globoid_centre_distance_preserved(self):
+        """Globoid designs should also land on the requested centre distance"""
+        design = design_from_centre_distance(
+            centre_distance=40.0,
+            ratio=30,
+            worm_type=WormType.GLOBOID,
+            throat_reduction=0.1
+        )
+
+        assert pytest.approx(design.centre_distance, rel=1e-9) == 40.0
+
 
 class TestEfficiencyEstimate:
     """Tests for efficiency estimation"""
     
-    def test_efficiency_increases_with_lead_angle(self):
+    @pytest.mark.parametrize("lower,higher", [(5.0, 10.0), (10.0, 20.0)])
+    def test_efficiency_increases_with_lead_angle(self, lower, higher):
         """Higher lead angles should give higher efficiency"""
-        eff_5 = estimate_efficiency(5.0)
-        eff_10 = estimate_efficiency(10.0)
-        eff_20 = estimate_efficiency(20.0)
-        
-        assert eff_10 > eff_5
-        assert eff_20 > eff_10
+        assert estimate_efficiency(higher) > estimate_efficiency(lower)
     
-    def test_efficiency_bounds(self):
+    @pytest.mark.parametrize("angle", [1.0, 5.0, 10.0, 20.0, 45.0])
+    def test_efficiency_bounds(self, angle):
         """Efficiency should be between 0 and 1"""
-        for angle in [1, 5, 10, 20, 45]:
-            eff = estimate_efficiency(float(angle))
-            assert 0 <= eff <= 1
+        eff = estimate_efficiency(angle)
+        assert 0 <= eff <= 1
     
     def test_very_low_lead_angle(self):
         """Very low lead angles should have low efficiency"""
         eff = estimate_efficiency(2.0)
         assert eff < 0.5
 
+    @pytest.mark.parametrize("angle", [87.0, 88.0, 89.0, 90.0, 95.0, 135.0, 180.0])
+    def test_efficiency_zero_past_friction_limit(self, angle):
+        """Efficiency should be zero once lead + friction angle reaches 90°"""
+        assert estimate_efficiency(angle) == 0.0
+
+    def test_efficiency_memoized(self):
+        """Repeated calls should be served from the cache"""
+        estimate_efficiency.cache_clear()
+        first = estimate_efficiency(7.0)
+        second = estimate_efficiency(7.0)
+        assert first == second
+        assert estimate_efficiency.cache_info().hits == 1
+
 
 class TestSelfLocking:
     """Tests for self-locking determination"""
     
-    def test_low_lead_angle_self_locks(self):
-        """Low lead angle (<6°) should be self-locking"""
+    @pytest.mark.parametrize("target_lead_angle,expected", [
+        (4.0, True),    # Low lead angle (<6°) should be self-locking
+        (15.0, False),  # High lead angle should not self-lock
+    ])
+    def test_self_locking_by_lead_angle(self, target_lead_angle, expected):
+        """Self-locking should follow the lead angle"""
         design = design_from_wheel(
             wheel_od=64.0,
             ratio=30,
-            target_lead_angle=4.0
+            target_lead_angle=target_lead_angle
         )
-        assert design.self_locking
-    
-    def test_high_lead_angle_not_self_locking(self):
-        """High lead angle should not self-lock"""
-        design = design_from_wheel(
-            wheel_od=64.0,
-            ratio=30,
-            target_lead_angle=15.0
+        assert design.self_locking is expected
+
+    def test_performance_filled_when_not_provided(self, module_design):
+        """Directly constructed designs should derive efficiency and self-locking"""
+        rebuilt = WormGearDesign(
+            worm=module_design.worm,
+            wheel=module_design.wheel,
+            centre_distance=module_design.centre_distance,
+            ratio=module_design.ratio,
+            pressure_angle=module_design.pressure_angle,
+            backlash=module_design.backlash,
+            hand=module_design.hand
+        )
+        assert rebuilt.efficiency_estimate == module_design.efficiency_estimate
+        assert rebuilt.self_locking == module_design.self_locking
+
+    def test_constructor_recomputes_performance(self, module_design):
+        """Explicit efficiency/self-locking values should be recalculated"""
+        rebuilt = WormGearDesign(
+            worm=module_design.worm,
+            wheel=module_design.wheel,
+            centre_distance=module_design.centre_distance,
+            ratio=module_design.ratio,
+            pressure_angle=module_design.pressure_angle,
+            backlash=module_design.backlash,
+            hand=module_design.hand,
+            efficiency_estimate=0.0,
+            self_locking=True
+        )
+        assert rebuilt.efficiency_estimate == module_design.efficiency_estimate
+        assert rebuilt.self_locking is False
+
+    def test_from_computed_matches_constructor(self, module_design):
+        """from_computed should give the same design as the constructor"""
+        args = dict(
+            worm=module_design.worm,
+            wheel=module_design.wheel,
+            centre_distance=module_design.centre_distance,
+            ratio=module_design.ratio,
+            pressure_angle=module_design.pressure_angle,
+            backlash=module_design.backlash,
+            hand=module_design.hand,
         )
-        assert not design.self_locking
+        assert WormGearDesign.from_computed(
+            **args,
+            efficiency_estimate=module_design.efficiency_estimate,
+            self_locking=module_design.self_locking
+        ) == WormGearDesign(**args)
 
 
 class TestHandedness:
     """Tests for thread handedness"""
     
-    def test_right_hand_default(self):
+    def test_right_hand_default(self, envelope_design):
         """Default should be right-hand"""
-        design = design_from_envelope(
-            worm_od=20.0,
-            wheel_od=64.0,
-            ratio=30
-        )
-        assert design.hand == Hand.RIGHT
+        assert envelope_design.hand == Hand.RIGHT
     
     def test_left_hand_option(self):
         """Should accept left-hand option"""
@@ -331,11 +436,17 @@ class TestHandedness:
         )
         assert design.hand == Hand.LEFT
 
+    def test_hand_is_string_valued(self):
+        """Hand members should behave as their string values"""
+        assert Hand.RIGHT == "right"
+        assert Hand.LEFT == "left"
+        assert Hand("left") is Hand.LEFT
+
 
 class TestReferenceCalculations:
     """Tests against known reference values"""
     
-    def test_reference_case_1(self):
+    def test_reference_case_1(self, module_design):
         """
         Reference case: Module 2, ratio 30, target lead angle 7°
         
@@ -346,85 +457,53 @@ class TestReferenceCalculations:
         - Lead = π × 2 × 1 = 6.283mm
         - Worm pitch dia for 7° = lead / (π × tan(7°)) = 6.283 / (π × 0.1228) = 16.3mm
         """
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            target_lead_angle=7.0,
-            num_starts=1
-        )
-        
-        assert design.wheel.num_teeth == 30
-        assert pytest.approx(design.wheel.pitch_diameter, rel=1e-3) == 60.0
-        assert pytest.approx(design.wheel.tip_diameter, rel=1e-3) == 64.0
-        assert pytest.approx(design.worm.lead, rel=1e-3) == pi * 2.0
+        assert module_design.wheel.num_teeth == 30
+        assert pytest.approx(module_design.wheel.pitch_diameter, rel=1e-3) == 60.0
+        assert pytest.approx(module_design.wheel.tip_diameter, rel=1e-3) == 64.0
+        assert pytest.approx(module_design.worm.lead, rel=1e-3) == pi * 2.0
         
         # Lead angle should be close to 7°
-        assert pytest.approx(design.worm.lead_angle, abs=0.5) == 7.0
+        assert pytest.approx(module_design.worm.lead_angle, abs=0.5) == 7.0
 
 
 class TestWormProfile:
     """Tests for tooth profile types"""
 
-    def test_profile_za_default(self):
+    def test_profile_za_default(self, module_design):
         """Default profile should be ZA"""
-        design = design_from_module(module=2.0, ratio=30)
-        assert design.profile == WormProfile.ZA
+        assert module_design.profile == WormProfile.ZA
 
-    def test_profile_zk_option(self):
+    def test_profile_zk_option(self, zk_design):
         """Should accept ZK profile"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            profile=WormProfile.ZK
-        )
+        design = zk_design
         assert design.profile == WormProfile.ZK
 
-    def test_profile_in_manufacturing(self):
+    def test_profile_in_manufacturing(self, zk_design):
         """Profile should be included in manufacturing params"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            profile=WormProfile.ZK
-        )
+        design = zk_design
         assert design.manufacturing.profile == WormProfile.ZK
 
 
 class TestWormType:
     """Tests for worm geometry types"""
 
-    def test_cylindrical_default(self):
+    def test_cylindrical_default(self, module_design):
         """Default worm type should be cylindrical"""
-        design = design_from_module(module=2.0, ratio=30)
-        assert design.manufacturing.worm_type == WormType.CYLINDRICAL
+        assert module_design.manufacturing.worm_type == WormType.CYLINDRICAL
 
-    def test_globoid_option(self):
+    def test_globoid_option(self, globoid_design):
         """Should accept globoid worm type"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.GLOBOID
-        )
-        assert design.manufacturing.worm_type == WormType.GLOBOID
+        assert globoid_design.manufacturing.worm_type == WormType.GLOBOID
 
-    def test_globoid_has_throat_radii(self):
+    def test_globoid_has_throat_radii(self, globoid_design):
         """Globoid worm should have throat radii calculated"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.GLOBOID
-        )
-        assert design.worm.throat_pitch_radius is not None
-        assert design.worm.throat_tip_radius is not None
-        assert design.worm.throat_root_radius is not None
+        assert globoid_design.worm.throat_pitch_radius is not None
+        assert globoid_design.worm.throat_tip_radius is not None
+        assert globoid_design.worm.throat_root_radius is not None
 
-    def test_cylindrical_no_throat_radii(self):
+    def test_cylindrical_no_throat_radii(self, module_design):
         """Cylindrical worm should not have throat radii"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.CYLINDRICAL
-        )
-        assert design.worm.throat_pitch_radius is None
+        assert module_design.worm.throat_pitch_radius is None
 
 
 class TestGloboidThroatRadii:
@@ -448,42 +527,29 @@ class TestGloboidThroatRadii:
         # throat_root_radius = throat_pitch - dedendum
         assert pytest.approx(throat_root, rel=1e-6) == 10.0 - 2.5
 
-    def test_globoid_design_throat_consistency(self):
+    def test_globoid_design_throat_consistency(self, globoid_design):
         """Globoid design throat radii should be consistent"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.GLOBOID
-        )
-
         # Throat pitch radius should equal centre_distance - wheel_pitch_radius
-        expected_throat = design.centre_distance - design.wheel.pitch_radius
-        assert pytest.approx(design.worm.throat_pitch_radius, rel=1e-3) == expected_throat
+        expected_throat = globoid_design.centre_distance - globoid_design.wheel.pitch_radius
+        assert pytest.approx(globoid_design.worm.throat_pitch_radius, rel=1e-3) == expected_throat
 
 
 class TestManufacturingParams:
     """Tests for manufacturing parameters"""
 
-    def test_manufacturing_params_exist(self):
+    def test_manufacturing_params_exist(self, module_design):
         """Design should include manufacturing params"""
-        design = design_from_module(module=2.0, ratio=30)
-        assert design.manufacturing is not None
+        assert module_design.manufacturing is not None
 
-    def test_worm_length_reasonable(self):
+    def test_worm_length_reasonable(self, module_design):
         """Worm length should be reasonable (>= 4× lead for cylindrical)"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.CYLINDRICAL
-        )
-        min_length = design.worm.lead * 4
-        assert design.manufacturing.worm_length >= min_length * 0.9  # Allow some tolerance
+        min_length = module_design.worm.lead * 4
+        assert module_design.manufacturing.worm_length >= min_length * 0.9  # Allow some tolerance
 
-    def test_wheel_width_reasonable(self):
+    def test_wheel_width_reasonable(self, module_design):
         """Wheel width should be reasonable (~10× module)"""
-        design = design_from_module(module=2.0, ratio=30)
         expected_width = 2.0 * 10
-        assert pytest.approx(design.manufacturing.wheel_width, rel=0.1) == expected_width
+        assert pytest.approx(module_design.manufacturing.wheel_width, rel=0.1) == expected_width
 
     def test_wheel_throated_option(self):
         """Should accept wheel_throated option"""
@@ -494,10 +560,9 @@ class TestManufacturingParams:
         )
         assert design.manufacturing.wheel_throated is True
 
-    def test_wheel_throated_default_false(self):
+    def test_wheel_throated_default_false(self, module_design):
         """Default wheel_throated should be False"""
-        design = design_from_module(module=2.0, ratio=30)
-        assert design.manufacturing.wheel_throated is False
+        assert module_design.manufacturing.wheel_throated is False
 
 
 class TestCalculateManufacturingParams:
@@ -525,3 +590,37 @@ class TestCalculateManufacturingParams:
             profile=WormProfile.ZK
         )
         assert params.profile == WormProfile.ZK
+
+
+class TestPackageImports:
+    """Tests for lazy package-level exports"""
+
+    def test_import_loads_core_only(self):
+        """Importing the package should not load validation or output"""
+        code = (
+            "import sys, wormcalc; "
+            "print(sorted(m for m in sys.modules if m.startswith('wormcalc')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert "wormcalc.validation" not in out
+        assert "wormcalc.output" not in out
+
+    def test_lazy_names_resolve(self):
+        """Lazily exported names should resolve to the submodule objects"""
+        import wormcalc
+        from wormcalc.validation import validate_design
+        from wormcalc.output import to_json
+
+        assert wormcalc.validate_design is validate_design
+        assert wormcalc.to_json is to_json
+        for name in wormcalc.__all__:
+            assert hasattr(wormcalc, name)
+
+    def test_unknown_name_raises(self):
+        """Unknown attributes should still raise AttributeError"""
+        import wormcalc
+        with pytest.raises(AttributeError):
+            wormcalc.not_a_real_name
+
@@ -9,82 +9,65 @@ import json
 
 from wormcalc.core import (
     design_from_module, design_from_envelope,
-    WormProfile, WormType, Hand
+    WormType, Hand
 )
 from wormcalc.validation import validate_design
 from wormcalc.output import to_json, to_markdown, to_summary
 
 
+@pytest.fixture(scope="module")
+def module_outputs(module_design, module_validation):
+    """Each format's output for the shared module 2 / ratio 30 design, rendered once"""
+    return {
+        'json': to_json(module_design, module_validation),
+        'markdown': to_markdown(module_design, module_validation),
+        'summary': to_summary(module_design),
+    }
+
+
+@pytest.fixture(scope="module")
+def module_json(module_outputs):
+    """The shared design's JSON output, parsed once"""
+    return json.loads(module_outputs['json'])
+
+
 class TestToJson:
     """Tests for JSON output"""
 
-    def test_json_valid_schema(self):
+    def test_json_valid_schema(self, module_json):
         """JSON output should be valid and parseable"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-        json_str = to_json(design, result)
-
-        # Should parse without error
-        data = json.loads(json_str)
-
         # Check top-level structure
-        assert 'worm' in data
-        assert 'wheel' in data
-        assert 'assembly' in data
-        assert 'validation' in data
-        assert data['assembly']['ratio'] == 30
-
-    def test_json_worm_fields(self):
-        """JSON should include all worm parameters"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-        data = json.loads(to_json(design, result))
+        assert 'worm' in module_json
+        assert 'wheel' in module_json
+        assert 'assembly' in module_json
+        assert 'validation' in module_json
+        assert module_json['assembly']['ratio'] == 30
+
+    @pytest.mark.parametrize("section,keys", [
+        ('worm', ['module_mm', 'pitch_diameter_mm', 'tip_diameter_mm', 'root_diameter_mm',
+                  'lead_mm', 'lead_angle_deg', 'num_starts']),
+        ('wheel', ['module_mm', 'num_teeth', 'pitch_diameter_mm', 'tip_diameter_mm',
+                   'root_diameter_mm', 'helix_angle_deg']),
+        ('validation', ['valid', 'messages']),
+        ('manufacturing', ['profile', 'worm_type', 'worm_length', 'wheel_width',
+                           'wheel_throated']),
+    ])
+    def test_json_section_fields(self, module_json, section, keys):
+        """JSON should include all parameters for each section"""
+        for key in keys:
+            assert key in module_json[section]
+
+    def test_json_validation_types(self, module_json):
+        """JSON validation results should have the expected types"""
+        validation = module_json['validation']
 
-        worm = data['worm']
-        assert 'module_mm' in worm
-        assert 'pitch_diameter_mm' in worm
-        assert 'tip_diameter_mm' in worm
-        assert 'root_diameter_mm' in worm
-        assert 'lead_mm' in worm
-        assert 'lead_angle_deg' in worm
-        assert 'num_starts' in worm
-
-    def test_json_wheel_fields(self):
-        """JSON should include all wheel parameters"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-        data = json.loads(to_json(design, result))
-
-        wheel = data['wheel']
-        assert 'module_mm' in wheel
-        assert 'num_teeth' in wheel
-        assert 'pitch_diameter_mm' in wheel
-        assert 'tip_diameter_mm' in wheel
-        assert 'root_diameter_mm' in wheel
-        assert 'helix_angle_deg' in wheel
-
-    def test_json_validation_fields(self):
-        """JSON should include validation results"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-        data = json.loads(to_json(design, result))
-
-        validation = data['validation']
-        assert 'valid' in validation
-        assert 'messages' in validation
         assert isinstance(validation['valid'], bool)
         assert isinstance(validation['messages'], list)
 
-    def test_json_globoid_fields(self):
+    def test_json_globoid_fields(self, globoid_reduced_design):
         """JSON should include globoid-specific fields when applicable"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.GLOBOID,
-            throat_reduction=0.05
-        )
-        result = validate_design(design)
-        data = json.loads(to_json(design, result))
+        design = globoid_reduced_design
+        data = json.loads(to_json(design))
 
         worm = data['worm']
         assert 'throat_reduction_mm' in worm
@@ -99,25 +82,11 @@ class TestToJson:
             ratio=30,
             worm_type=WormType.CYLINDRICAL
         )
-        result = validate_design(design)
-        data = json.loads(to_json(design, result))
+        data = json.loads(to_json(design))
 
         worm = data['worm']
         assert 'throat_pitch_radius_mm' not in worm
 
-    def test_json_manufacturing_fields(self):
-        """JSON should include manufacturing parameters"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-        data = json.loads(to_json(design, result))
-
-        manufacturing = data['manufacturing']
-        assert 'profile' in manufacturing
-        assert 'worm_type' in manufacturing
-        assert 'worm_length' in manufacturing
-        assert 'wheel_width' in manufacturing
-        assert 'wheel_throated' in manufacturing
-
     def test_json_with_profile_shift(self):
         """JSON should include profile shift when non-zero"""
         design = design_from_module(
@@ -125,8 +94,7 @@ class TestToJson:
             ratio=30,
             profile_shift=0.3
         )
-        result = validate_design(design)
-        data = json.loads(to_json(design, result))
+        data = json.loads(to_json(design))
 
         assert 'profile_shift' in data['wheel']
         assert data['wheel']['profile_shift'] == 0.3
@@ -138,8 +106,7 @@ class TestToJson:
             ratio=30,
             backlash=0.1
         )
-        result = validate_design(design)
-        data = json.loads(to_json(design, result))
+        data = json.loads(to_json(design))
 
         assert 'backlash_mm' in data['assembly']
         assert data['assembly']['backlash_mm'] == 0.1
@@ -148,22 +115,18 @@ class TestToJson:
 class TestToMarkdown:
     """Tests for Markdown output"""
 
-    def test_markdown_structure(self):
+    def test_markdown_structure(self, module_design, module_validation):
         """Markdown should have expected structure"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-        md = to_markdown(design, result)
+        md = to_markdown(module_design, module_validation)
 
         assert '# Worm Gear Design' in md
         assert '## Worm' in md
         assert '## Wheel' in md
         assert '## Manufacturing' in md
 
-    def test_markdown_includes_key_values(self):
+    def test_markdown_includes_key_values(self, module_design, module_validation):
         """Markdown should include key design values"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-        md = to_markdown(design, result)
+        md = to_markdown(module_design, module_validation)
 
         assert '2.0' in md  # Module value
         assert '30:1' in md or 'Ratio: 30' in md  # Ratio
@@ -178,28 +141,17 @@ class TestToMarkdown:
         assert '## Validation' in md
         assert '### Errors' in md or 'ERROR' in md
 
-    def test_markdown_globoid_section(self):
+    def test_markdown_globoid_section(self, globoid_reduced_design):
         """Markdown should include globoid info when applicable"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.GLOBOID,
-            throat_reduction=0.05
-        )
-        result = validate_design(design)
-        md = to_markdown(design, result)
+        design = globoid_reduced_design
+        md = to_markdown(design)
 
         assert 'globoid' in md.lower() or 'throat' in md.lower()
 
-    def test_markdown_zk_profile(self):
+    def test_markdown_zk_profile(self, zk_design):
         """Markdown should mention ZK profile"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            profile=WormProfile.ZK
-        )
-        result = validate_design(design)
-        md = to_markdown(design, result)
+        design = zk_design
+        md = to_markdown(design)
 
         assert 'ZK' in md
 
@@ -210,8 +162,7 @@ class TestToMarkdown:
             ratio=30,
             hand=Hand.LEFT
         )
-        result = validate_design(design)
-        md = to_markdown(design, result)
+        md = to_markdown(design)
 
         assert 'left' in md.lower() or 'LEFT' in md
 
@@ -219,28 +170,25 @@ class TestToMarkdown:
 class TestToSummary:
     """Tests for text summary output"""
 
-    def test_summary_contains_design_info(self):
+    def test_summary_contains_design_info(self, module_design):
         """Summary should include key design information"""
-        design = design_from_module(module=2.0, ratio=30)
-        summary = to_summary(design)
+        summary = to_summary(module_design)
 
         assert 'Worm Gear Design' in summary
         assert 'Ratio' in summary
         assert 'Module' in summary
 
-    def test_summary_contains_worm_info(self):
+    def test_summary_contains_worm_info(self, module_design):
         """Summary should include worm parameters"""
-        design = design_from_module(module=2.0, ratio=30)
-        summary = to_summary(design)
+        summary = to_summary(module_design)
 
         assert 'Worm:' in summary
         assert 'Tip diameter' in summary or 'OD' in summary
         assert 'Lead angle' in summary
 
-    def test_summary_contains_wheel_info(self):
+    def test_summary_contains_wheel_info(self, module_design):
         """Summary should include wheel parameters"""
-        design = design_from_module(module=2.0, ratio=30)
-        summary = to_summary(design)
+        summary = to_summary(module_design)
 
         assert 'Wheel:' in summary
         assert 'Teeth' in summary
@@ -267,14 +215,9 @@ class TestToSummary:
 
         assert 'Self-locking: No' in summary
 
-    def test_summary_globoid(self):
+    def test_summary_globoid(self, globoid_reduced_design):
         """Summary should indicate globoid worm type"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.GLOBOID,
-            throat_reduction=0.05
-        )
+        design = globoid_reduced_design
         summary = to_summary(design)
 
         assert 'globoid' in summary.lower()
@@ -314,11 +257,10 @@ class TestOutputEdgeCases:
         assert data['assembly']['ratio'] == 100
         assert data['wheel']['num_teeth'] == 100
 
-    def test_markdown_no_validation(self):
+    def test_markdown_no_validation(self, module_design):
         """Markdown should work without validation result"""
-        design = design_from_module(module=2.0, ratio=30)
         # Don't validate - pass None
-        md = to_markdown(design, None)
+        md = to_markdown(module_design, None)
 
         assert '# Worm Gear Design' in md
         assert 'Validation' not in md or 'Not validated' in md
@@ -339,31 +281,14 @@ class TestOutputEdgeCases:
 class TestOutputConsistency:
     """Tests that outputs remain consistent for same input"""
 
-    def test_json_deterministic(self):
-        """JSON output should be deterministic"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-
-        json1 = to_json(design, result)
-        json2 = to_json(design, result)
-
-        assert json1 == json2
-
-    def test_markdown_deterministic(self):
-        """Markdown output should be deterministic"""
-        design = design_from_module(module=2.0, ratio=30)
-        result = validate_design(design)
-
-        md1 = to_markdown(design, result)
-        md2 = to_markdown(design, result)
-
-        assert md1 == md2
-
-    def test_summary_deterministic(self):
-        """Summary output should be deterministic"""
-        design = design_from_module(module=2.0, ratio=30)
-
-        summary1 = to_summary(design)
-        summary2 = to_summary(design)
-
-        assert summary1 == summary2
+    @pytest.mark.parametrize("output_format", ['json', 'markdown', 'summary'])
+    def test_output_deterministic(self, module_design, module_validation,
+                                  module_outputs, output_format):
+        """Formatting the same design again should reproduce the first output"""
+        formatters = {
+            'json': lambda: to_json(module_design, module_validation),
+            'markdown': lambda: to_markdown(module_design, module_validation),
+            'summary': lambda: to_summary(module_design),
+        }
+
+        assert formatters[output_format]() == module_outputs[output_format]
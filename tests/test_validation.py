@@ -5,48 +5,83 @@ Test that validation rules catch expected issues.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError
+from math import sin, radians
 
 from wormcalc.core import (
     design_from_envelope, design_from_wheel, design_from_module,
-    WormProfile, WormType
+    DesignResult, WormProfile, WormType
 )
 from wormcalc.validation import (
     validate_design,
+    clear_validation_cache,
+    create_design_result,
+    calculate_minimum_teeth,
+    calculate_profile_shift,
+    is_valid,
     Severity,
     ValidationResult,
 )
 
 
+# Read-only designs and results shared by this module's assertion-only tests.
+# The shared module 2 / ratio 30, globoid and ZK designs live in conftest.py.
+
+@pytest.fixture(scope="module")
+def small_module_design():
+    """design_from_module(module=0.2, ratio=30) - fails MODULE_TOO_SMALL"""
+    return design_from_module(module=0.2, ratio=30)
+
+
+@pytest.fixture(scope="module")
+def small_module_validation(small_module_design):
+    """validate_design(small_module_design)"""
+    return validate_design(small_module_design)
+
+
+@pytest.fixture(scope="module")
+def non_standard_validation():
+    """validate_design for module 2.3 (not in ISO 54), ratio 30"""
+    return validate_design(design_from_module(module=2.3, ratio=30))
+
+
+class TestMinimumTeeth:
+    """Tests for undercut limits"""
+
+    @pytest.mark.parametrize("pressure_angle", [14.5, 20.0, 25.0, 17.5, 22.5])
+    def test_matches_formula(self, pressure_angle):
+        """Table and fallback should both follow z_min = 2 / sin²(α)"""
+        sin_alpha = sin(radians(pressure_angle))
+        assert calculate_minimum_teeth(pressure_angle) == int(2.0 / sin_alpha ** 2) + 1
+
+    def test_standard_values(self):
+        """Standard pressure angles should give the textbook limits"""
+        assert calculate_minimum_teeth(14.5) == 32
+        assert calculate_minimum_teeth(20.0) == 18
+        assert calculate_minimum_teeth(25.0) == 12
+
+    def test_profile_shift_only_below_minimum(self):
+        """Profile shift should only be recommended below z_min"""
+        assert calculate_profile_shift(18, 20.0) is None
+        assert calculate_profile_shift(12, 20.0) == pytest.approx((18 - 12) / 18 * 1.1)
+
+
 class TestLeadAngleValidation:
     """Tests for lead angle validation rules"""
-    
-    def test_very_low_lead_angle_error(self):
-        """Lead angle < 1° should be an error"""
-        # Create design with very low lead angle (large worm diameter)
-        design = design_from_wheel(
-            wheel_od=64.0,
-            ratio=30,
-            target_lead_angle=0.5
-        )
-        
-        result = validate_design(design)
-        
-        error_codes = [m.code for m in result.errors]
-        assert "LEAD_ANGLE_TOO_LOW" in error_codes
-    
-    def test_low_lead_angle_warning(self):
-        """Lead angle 1-3° should be a warning"""
-        design = design_from_wheel(
-            wheel_od=64.0,
-            ratio=30,
-            target_lead_angle=2.0
-        )
-        
+
+    @pytest.mark.parametrize("lead_angle,code,severity", [
+        (0.5, "LEAD_ANGLE_TOO_LOW", Severity.ERROR),     # < 1° is an error
+        (2.0, "LEAD_ANGLE_VERY_LOW", Severity.WARNING),  # 1-3° warns
+        (30.0, "LEAD_ANGLE_HIGH", Severity.WARNING),     # > 25° warns about self-locking
+    ])
+    def test_lead_angle_flagged(self, lead_angle, code, severity):
+        """Out-of-range lead angles should be reported at the right severity"""
+        design = design_from_wheel(wheel_od=64.0, ratio=30, target_lead_angle=lead_angle)
+
         result = validate_design(design)
-        
-        warning_codes = [m.code for m in result.warnings]
-        assert "LEAD_ANGLE_VERY_LOW" in warning_codes
-    
+
+        assert code in result.code_set[severity]
+
     def test_normal_lead_angle_ok(self):
         """Lead angle 5-25° should be valid"""
         design = design_from_wheel(
@@ -61,140 +96,74 @@ class TestLeadAngleValidation:
         assert result.valid
         
         # Should not have lead angle errors or warnings
-        codes = [m.code for m in result.errors + result.warnings]
+        codes = result.non_info_codes
         assert "LEAD_ANGLE_TOO_LOW" not in codes
         assert "LEAD_ANGLE_VERY_LOW" not in codes
         assert "LEAD_ANGLE_HIGH" not in codes
-    
-    def test_high_lead_angle_warning(self):
-        """Lead angle > 25° should warn about self-locking"""
-        design = design_from_wheel(
-            wheel_od=64.0,
-            ratio=30,
-            target_lead_angle=30.0
-        )
-        
-        result = validate_design(design)
-        
-        warning_codes = [m.code for m in result.warnings]
-        assert "LEAD_ANGLE_HIGH" in warning_codes
 
 
 class TestModuleValidation:
     """Tests for module validation rules"""
     
-    def test_standard_module_ok(self):
+    def test_standard_module_ok(self, module_validation):
         """Standard module should not produce warnings"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30
-        )
-        
-        result = validate_design(design)
-        
-        codes = [m.code for m in result.messages]
+        codes = module_validation.all_codes
         assert "MODULE_NON_STANDARD" not in codes
     
-    def test_non_standard_module_warning(self):
+    def test_non_standard_module_warning(self, non_standard_validation):
         """Non-standard module should warn"""
-        design = design_from_module(
-            module=2.3,  # Not standard
-            ratio=30
-        )
-        
-        result = validate_design(design)
-        
+        result = non_standard_validation
+
         # Should have module warning
-        codes = [m.code for m in result.warnings + result.infos]
+        codes = result.code_set[Severity.WARNING] | result.code_set[Severity.INFO]
         assert "MODULE_NON_STANDARD" in codes or "MODULE_NEAR_STANDARD" in codes
     
-    def test_very_small_module_error(self):
+    def test_very_small_module_error(self, small_module_validation):
         """Module < 0.3mm should error"""
-        design = design_from_module(
-            module=0.2,
-            ratio=30
-        )
-        
-        result = validate_design(design)
-        
-        error_codes = [m.code for m in result.errors]
+        error_codes = small_module_validation.code_set[Severity.ERROR]
         assert "MODULE_TOO_SMALL" in error_codes
 
 
 class TestTeethCountValidation:
     """Tests for wheel teeth count validation"""
-    
-    def test_very_few_teeth_error(self):
-        """< 17 teeth should error"""
-        # Use envelope to force low teeth count
-        # Small wheel OD + low ratio = few teeth
-        design = design_from_envelope(
-            worm_od=10.0,
-            wheel_od=20.0,  # Very small
-            ratio=8  # 8 teeth with 1 start
-        )
-        
-        result = validate_design(design)
-        
-        error_codes = [m.code for m in result.errors]
-        assert "TEETH_TOO_FEW" in error_codes
-    
-    def test_low_teeth_warning(self):
-        """17-24 teeth should warn"""
-        design = design_from_envelope(
-            worm_od=20.0,  # Larger to avoid WORM_THIN warning
-            wheel_od=50.0,
-            ratio=22  # 22 teeth - in warning range (17-24)
-        )
+
+    # Small wheel OD + low ratio forces few teeth (1 start, so teeth == ratio)
+    @pytest.mark.parametrize("worm_od,wheel_od,ratio,code,severity", [
+        (10.0, 20.0, 8, "TEETH_TOO_FEW", Severity.ERROR),  # < 17 teeth
+        (20.0, 50.0, 22, "TEETH_LOW", Severity.WARNING),   # 17-24; larger worm avoids WORM_THIN
+    ])
+    def test_few_teeth_flagged(self, worm_od, wheel_od, ratio, code, severity):
+        """Low teeth counts should be reported at the right severity"""
+        design = design_from_envelope(worm_od=worm_od, wheel_od=wheel_od, ratio=ratio)
 
         result = validate_design(design)
 
-        warning_codes = [m.code for m in result.warnings]
-        assert "TEETH_LOW" in warning_codes
+        assert code in result.code_set[severity]
     
-    def test_normal_teeth_ok(self):
+    def test_normal_teeth_ok(self, module_validation):
         """24+ teeth should be fine"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30  # 30 teeth
-        )
-        
-        result = validate_design(design)
-        
-        codes = [m.code for m in result.errors + result.warnings]
+        result = module_validation  # 30 teeth
+
+        codes = result.non_info_codes
         assert "TEETH_TOO_FEW" not in codes
         assert "TEETH_LOW" not in codes
 
 
 class TestWormProportionsValidation:
     """Tests for worm proportion validation"""
-    
-    def test_thin_worm_warning(self):
-        """Worm pitch dia < 5×module should warn"""
-        # Force thin worm by specifying small pitch diameter
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_pitch_diameter=8.0  # Only 4× module
-        )
-        
-        result = validate_design(design)
-        
-        warning_codes = [m.code for m in result.warnings]
-        assert "WORM_THIN" in warning_codes
-    
-    def test_very_thin_worm_error(self):
-        """Worm pitch dia < 3×module should error"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_pitch_diameter=5.0  # Only 2.5× module
-        )
-        
+
+    @pytest.mark.parametrize("worm_pitch_diameter,code,severity", [
+        (8.0, "WORM_THIN", Severity.WARNING),    # 4× module: < 5× warns
+        (5.0, "WORM_TOO_THIN", Severity.ERROR),  # 2.5× module: < 3× errors
+    ])
+    def test_thin_worm_flagged(self, worm_pitch_diameter, code, severity):
+        """Thin worms should be reported at the right severity"""
+        design = design_from_module(module=2.0, ratio=30,
+                                    worm_pitch_diameter=worm_pitch_diameter)
+
         result = validate_design(design)
-        
-        error_codes = [m.code for m in result.errors]
-        assert "WORM_TOO_THIN" in error_codes
+
+        assert code in result.code_set[severity]
 
 
 class TestOverallValidation:
@@ -213,15 +182,10 @@ class TestOverallValidation:
         assert result.valid
         assert len(result.errors) == 0
     
-    def test_errors_make_invalid(self):
+    def test_errors_make_invalid(self, small_module_validation):
         """Any error should make design invalid"""
-        design = design_from_module(
-            module=0.2,  # Too small - will error
-            ratio=30
-        )
-        
-        result = validate_design(design)
-        
+        result = small_module_validation
+
         assert not result.valid
         assert len(result.errors) > 0
     
@@ -238,21 +202,200 @@ class TestOverallValidation:
         # May have warnings but should still be valid
         assert result.valid
 
+    def test_results_use_slots(self, non_standard_validation):
+        """Validation results and messages should not carry a __dict__"""
+        result = non_standard_validation
+        assert not hasattr(result, "__dict__")
+        assert not any(hasattr(m, "__dict__") for m in result.messages)
+
+    def test_messages_immutable(self, non_standard_validation):
+        """Validation messages should be read-only, so they can be shared"""
+        result = non_standard_validation
+        with pytest.raises(FrozenInstanceError):
+            result.messages[0].message = "changed"
+
+    def test_severity_buckets_partition_messages(self, small_module_validation):
+        """errors/warnings/infos should split messages by severity, in order"""
+        result = small_module_validation
+
+        for severity, bucket in ((Severity.ERROR, result.errors),
+                                 (Severity.WARNING, result.warnings),
+                                 (Severity.INFO, result.infos)):
+            assert bucket == [m for m in result.messages if m.severity == severity]
+        assert len(result.errors) + len(result.warnings) + len(result.infos) == len(result.messages)
+
+    def test_code_set_matches_messages(self, small_module_validation):
+        """code_set, non_info_codes and all_codes should match the messages"""
+        result = small_module_validation
+
+        for severity in Severity:
+            assert result.code_set[severity] == {
+                m.code for m in result.messages if m.severity == severity
+            }
+        assert result.non_info_codes == {
+            m.code for m in result.messages if m.severity is not Severity.INFO
+        }
+        assert result.all_codes == {m.code for m in result.messages}
+
+    def test_design_result_matches_validation(self, small_module_design,
+                                              small_module_validation):
+        """create_design_result should summarise the validation messages"""
+        design = small_module_design
+        validation = small_module_validation
+
+        result = create_design_result(design)
+
+        assert result.design is design
+        assert result.valid == validation.valid
+        assert result.errors == [m.message for m in validation.errors]
+        assert result.warnings == [m.message for m in validation.warnings]
+        assert result.suggestions == [
+            m.suggestion for m in validation.messages if m.suggestion
+        ]
+
+    def test_design_result_lists_appendable(self, module_design):
+        """DesignResult message fields should be lists callers can extend"""
+        result = DesignResult(design=module_design, valid=True)
+        result.warnings.append("checked by hand")
+
+        assert result.warnings == ["checked by hand"]
+        assert DesignResult(design=module_design, valid=True).warnings == []
+
+
+class TestValidationCache:
+    """Tests for memoized validation"""
+
+    def test_repeat_validation_matches(self):
+        """Cached results should equal a fresh validation"""
+        clear_validation_cache()
+        design = design_from_module(module=2.3, ratio=30)
+        first = validate_design(design)
+        second = validate_design(design)
+
+        assert first == second
+        assert first is not second
+
+    def test_identical_designs_share_entry(self):
+        """Separately built but identical designs should hit the cache"""
+        clear_validation_cache()
+        validate_design(design_from_module(module=2.0, ratio=30))
+
+        from wormcalc.validation import _VALIDATION_CACHE
+        validate_design(design_from_module(module=2.0, ratio=30))
+        assert len(_VALIDATION_CACHE) == 1
+
+    def test_returned_messages_are_independent(self):
+        """Mutating a returned result should not affect later calls"""
+        design = design_from_module(module=2.0, ratio=30)
+        result = validate_design(design)
+        count = len(result.messages)
+        result.messages.clear()
+
+        assert len(validate_design(design).messages) == count
+
+    def test_changed_design_revalidated(self):
+        """Changing a validated value should give a fresh result"""
+        design = design_from_module(module=2.0, ratio=30)
+        assert validate_design(design).valid
+
+        design.centre_distance = 1.0
+        codes = validate_design(design).all_codes
+        assert "INTERFERENCE" in codes
+
+    def test_equal_values_of_other_types_not_shared(self):
+        """17 and 17.0 print differently, so each should get its own messages"""
+        clear_validation_cache()
+        as_float = validate_design(design_from_module(module=2.0, ratio=30, pressure_angle=17.0))
+        as_int = validate_design(design_from_module(module=2.0, ratio=30, pressure_angle=17))
+
+        assert "Pressure angle 17.0° is non-standard" in [m.message for m in as_float.messages]
+        assert "Pressure angle 17° is non-standard" in [m.message for m in as_int.messages]
+
+
+class TestFailFast:
+    """Tests for fail-fast validation"""
+
+    def test_fail_fast_returns_first_error(self):
+        """fail_fast should stop at the first error"""
+        clear_validation_cache()
+        design = design_from_module(module=0.2, ratio=30)
+        full = validate_design(design)
+        clear_validation_cache()
+
+        result = validate_design(design, fail_fast=True)
+
+        assert not result.valid
+        assert result.messages == [full.errors[0]]
+
+    def test_fail_fast_uses_cached_result(self):
+        """A cached invalid result should be cut down to its first error"""
+        design = design_from_module(module=0.2, ratio=30)
+        full = validate_design(design)
+
+        result = validate_design(design, fail_fast=True)
+
+        assert result.messages == [full.errors[0]]
+
+    def test_fail_fast_valid_design_unchanged(self):
+        """Valid designs should get the full message list"""
+        design = design_from_module(module=2.0, ratio=30, target_lead_angle=8.0)
+        assert validate_design(design, fail_fast=True) == validate_design(design)
+
+
+class TestIsValid:
+    """Tests for the message-free validity check"""
+
+    @pytest.mark.parametrize("module", [0.2, 0.4, 1.0, 2.0, 5.0])
+    @pytest.mark.parametrize("ratio", [10, 15, 30, 60])
+    @pytest.mark.parametrize("lead_angle", [0.5, 3.0, 7.0, 30.0])
+    def test_matches_validate_design(self, module, ratio, lead_angle):
+        """is_valid should agree with validate_design for cylindrical worms"""
+        design = design_from_module(module=module, ratio=ratio, target_lead_angle=lead_angle)
+        assert is_valid(design) == validate_design(design).valid
+
+    @pytest.mark.parametrize("module", [0.3, 1.0, 2.0])
+    @pytest.mark.parametrize("worm_pitch_diameter", [2.5, 4.0, 6.0, 10.0, 30.0])
+    @pytest.mark.parametrize("pressure_angle", [14.5, 20.0, 25.0])
+    @pytest.mark.parametrize("ratio", [12, 20, 40])
+    def test_matches_validate_design_at_limits(self, module, worm_pitch_diameter,
+                                               pressure_angle, ratio):
+        """is_valid should agree around the thin-worm, root, undercut and clearance limits"""
+        design = design_from_module(module=module, ratio=ratio,
+                                    worm_pitch_diameter=worm_pitch_diameter,
+                                    pressure_angle=pressure_angle)
+        assert is_valid(design) == validate_design(design).valid
+
+    @pytest.mark.parametrize("throat_reduction", [0.0, 0.01, 0.1, 0.8, 1.5, 5.0])
+    @pytest.mark.parametrize("worm_od", [12.0, 20.0])
+    def test_matches_validate_design_globoid(self, throat_reduction, worm_od):
+        """is_valid should agree with validate_design for globoid worms"""
+        design = design_from_envelope(
+            worm_od=worm_od, wheel_od=65, ratio=30,
+            worm_type=WormType.GLOBOID, throat_reduction=throat_reduction,
+            wheel_throated=True
+        )
+        assert is_valid(design) == validate_design(design).valid
+
+    def test_invalid_profile(self):
+        """A non-enum profile should be invalid"""
+        design = design_from_module(module=2.0, ratio=30)
+        design.profile = "ZA"
+        assert not is_valid(design)
+
+    def test_no_manufacturing_params(self):
+        """Designs without manufacturing params should still be checked"""
+        design = design_from_module(module=2.0, ratio=30)
+        design.manufacturing = None
+        assert is_valid(design) == validate_design(design).valid
+
 
 class TestSuggestions:
     """Tests that validation provides useful suggestions"""
     
-    def test_module_suggestion_includes_nearest(self):
+    def test_module_suggestion_includes_nearest(self, non_standard_validation):
         """Non-standard module should suggest nearest standard"""
-        design = design_from_module(
-            module=2.3,
-            ratio=30
-        )
-        
-        result = validate_design(design)
-        
         # Find the module message
-        module_msgs = [m for m in result.messages 
+        module_msgs = [m for m in non_standard_validation.messages 
                       if "MODULE" in m.code and m.suggestion]
         
         assert len(module_msgs) > 0
@@ -280,73 +423,48 @@ class TestSuggestions:
 class TestProfileValidation:
     """Tests for profile type validation"""
 
-    def test_za_profile_valid(self):
+    def test_za_profile_valid(self, module_design, module_validation):
         """ZA profile should be valid"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            profile=WormProfile.ZA
-        )
-        result = validate_design(design)
+        assert module_design.profile is WormProfile.ZA
 
-        error_codes = [m.code for m in result.errors]
+        error_codes = module_validation.code_set[Severity.ERROR]
         assert "PROFILE_INVALID" not in error_codes
 
-    def test_zk_profile_info(self):
+    def test_zk_profile_info(self, zk_design):
         """ZK profile should produce info message"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            profile=WormProfile.ZK
-        )
-        result = validate_design(design)
+        result = validate_design(zk_design)
 
-        info_codes = [m.code for m in result.infos]
+        info_codes = result.code_set[Severity.INFO]
         assert "PROFILE_ZK" in info_codes
 
 
 class TestWormTypeValidation:
     """Tests for worm type validation"""
 
-    def test_cylindrical_valid(self):
+    def test_cylindrical_valid(self, module_design, module_validation):
         """Cylindrical worm should be valid"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.CYLINDRICAL
-        )
-        result = validate_design(design)
+        assert module_design.manufacturing.worm_type is WormType.CYLINDRICAL
 
-        error_codes = [m.code for m in result.errors]
+        error_codes = module_validation.code_set[Severity.ERROR]
         assert "WORM_TYPE_INVALID" not in error_codes
 
-    def test_globoid_info(self):
+    def test_globoid_info(self, globoid_design):
         """Globoid worm should produce info message"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.GLOBOID
-        )
-        result = validate_design(design)
+        result = validate_design(globoid_design)
 
-        info_codes = [m.code for m in result.infos]
+        info_codes = result.code_set[Severity.INFO]
         assert "GLOBOID_WORM" in info_codes
 
 
 class TestWheelThroatedValidation:
     """Tests for wheel throated validation"""
 
-    def test_globoid_non_throated_warning(self):
+    def test_globoid_non_throated_warning(self, globoid_design):
         """Globoid worm with non-throated wheel should warn"""
-        design = design_from_module(
-            module=2.0,
-            ratio=30,
-            worm_type=WormType.GLOBOID,
-            wheel_throated=False
-        )
-        result = validate_design(design)
+        assert not globoid_design.manufacturing.wheel_throated
+        result = validate_design(globoid_design)
 
-        warning_codes = [m.code for m in result.warnings]
+        warning_codes = result.code_set[Severity.WARNING]
         assert "GLOBOID_NON_THROATED" in warning_codes
 
     def test_globoid_throated_no_warning(self):
@@ -359,7 +477,7 @@ class TestWheelThroatedValidation:
         )
         result = validate_design(design)
 
-        warning_codes = [m.code for m in result.warnings]
+        warning_codes = result.code_set[Severity.WARNING]
         assert "GLOBOID_NON_THROATED" not in warning_codes
 
     def test_throated_info(self):
@@ -371,7 +489,7 @@ class TestWheelThroatedValidation:
         )
         result = validate_design(design)
 
-        info_codes = [m.code for m in result.infos]
+        info_codes = result.code_set[Severity.INFO]
         assert "WHEEL_THROATED" in info_codes
 
 
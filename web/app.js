@@ -17,7 +17,7 @@ async function initPyodide() {
         });
 
         // Load local Python files
-        const files = ['__init__.py', 'core.py', 'validation.py', 'output.py'];
+        const files = ['__init__.py', 'core.py', 'validation.py', 'output.py', 'batch.py'];
 
         // Create directory in Pyodide filesystem
         pyodide.FS.mkdir('/home/pyodide/wormcalc');
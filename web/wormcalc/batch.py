@@ -0,0 +1,449 @@
+"""
+Worm Gear Calculator - Batch Calculations
+
+Column-oriented (structure-of-arrays) calculations for parameter sweeps.
+No external dependencies beyond stdlib.
+
+Scalar design functions in core.py return fully-populated dataclasses, which
+is the right shape for a single design but wasteful when evaluating thousands
+of candidates. The functions here reuse the same scalar kernels and return
+one list per field instead, so sweeps only pay for the numbers they need.
+Results can be passed straight to numpy.asarray() if numpy is available.
+"""
+
+from dataclasses import dataclass, field, fields
+from itertools import product, repeat
+from numbers import Number
+from typing import Dict, Iterator, List, Sequence, Tuple, Union
+
+from .core import (
+    _worm_kernel, _wheel_kernel, _centre_distance_kernel,
+    _tan_friction_angle, _friction_angle, _efficiency_from_tangents,
+    _efficiency_at_angle, _DEG2RAD,
+    _design_core, Hand, WormProfile, WormType, WormGearDesign,
+    nearest_standard_module,
+)
+from .validation import (
+    calculate_minimum_teeth,
+    _MIN_LEAD_ANGLE, _MIN_MODULE, _MIN_WORM_DIA_TO_MODULE,
+    _MIN_WORM_ROOT_DIAMETER, _MIN_CLEARANCE,
+)
+
+
+Numeric = Union[float, int]
+NumericInput = Union[Numeric, Sequence[Numeric]]
+
+# Kernel output order, named as the matching dataclass fields
+_WORM_KERNEL_FIELDS = (
+    "tip_diameter", "root_diameter", "lead", "axial_pitch", "lead_angle",
+    "addendum", "dedendum", "thread_thickness",
+)
+_WHEEL_KERNEL_FIELDS = (
+    "pitch_diameter", "tip_diameter", "root_diameter", "throat_diameter",
+    "helix_angle", "addendum", "dedendum",
+)
+
+
+@dataclass
+class DesignBatch:
+    """Batch design results, one list per field (structure-of-arrays)"""
+    ratio: List[int] = field(default_factory=list)
+    num_starts: List[int] = field(default_factory=list)
+    num_teeth: List[int] = field(default_factory=list)
+    module: List[float] = field(default_factory=list)
+
+    # Worm
+    worm_pitch_diameter: List[float] = field(default_factory=list)
+    worm_tip_diameter: List[float] = field(default_factory=list)
+    worm_root_diameter: List[float] = field(default_factory=list)
+    lead: List[float] = field(default_factory=list)
+    axial_pitch: List[float] = field(default_factory=list)
+    lead_angle: List[float] = field(default_factory=list)
+
+    # Wheel
+    wheel_pitch_diameter: List[float] = field(default_factory=list)
+    wheel_tip_diameter: List[float] = field(default_factory=list)
+    wheel_root_diameter: List[float] = field(default_factory=list)
+
+    # Assembly and performance
+    centre_distance: List[float] = field(default_factory=list)
+    efficiency_estimate: List[float] = field(default_factory=list)
+    self_locking: List[bool] = field(default_factory=list)
+
+    # Settings shared by every row
+    pressure_angle: float = 20.0
+    backlash: float = 0.0
+    clearance_factor: float = 0.25
+    profile_shift: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.module)
+
+    def design(self, index: int) -> WormGearDesign:
+        """
+        Build the full WormGearDesign for one row.
+
+        Gives the same design as the scalar design_from_* call for that row
+        (right hand, ZA profile, cylindrical worm), including manufacturing
+        parameters.
+        """
+        return _design_core(
+            module=self.module[index],
+            num_teeth=self.num_teeth[index],
+            worm_pitch_diameter=self.worm_pitch_diameter[index],
+            ratio=self.ratio[index],
+            pressure_angle=self.pressure_angle,
+            backlash=self.backlash,
+            num_starts=self.num_starts[index],
+            clearance_factor=self.clearance_factor,
+            hand=Hand.RIGHT,
+            profile_shift=self.profile_shift,
+            profile=WormProfile.ZA,
+            worm_type=WormType.CYLINDRICAL,
+            throat_reduction=0.0,
+            wheel_throated=False
+        )
+
+    def to_designs(self) -> Iterator[WormGearDesign]:
+        """Build full designs row by row, only as they are consumed"""
+        return map(self.design, range(len(self)))
+
+
+# Settings are scalars; every other DesignBatch field is a per-row column
+_BATCH_SETTINGS = ("pressure_angle", "backlash", "clearance_factor", "profile_shift")
+BATCH_COLUMNS = tuple(f.name for f in fields(DesignBatch) if f.name not in _BATCH_SETTINGS)
+
+
+def _broadcast(*values: NumericInput) -> Tuple[List[Numeric], ...]:
+    """
+    Broadcast scalars and equal-length sequences to a common length.
+
+    Raises:
+        ValueError: If sequence inputs have different lengths
+    """
+    lengths = {len(v) for v in values if not isinstance(v, Number)}
+    if len(lengths) > 1:
+        raise ValueError(f"Batch inputs have mismatched lengths: {sorted(lengths)}")
+    n = lengths.pop() if lengths else 1
+
+    return tuple(
+        [v] * n if isinstance(v, Number) else list(v)
+        for v in values
+    )
+
+
+def _columns(names: Tuple[str, ...], rows: List[tuple]) -> Dict[str, List[float]]:
+    """Transpose kernel result rows into one list per named field"""
+    if not rows:
+        return {name: [] for name in names}
+    return {name: list(col) for name, col in zip(names, zip(*rows))}
+
+
+def calculate_worm_batch(
+    module: NumericInput,
+    num_starts: NumericInput,
+    pitch_diameter: NumericInput,
+    clearance_factor: float = 0.25,
+    backlash: float = 0.0
+) -> Dict[str, List[float]]:
+    """
+    Batch version of calculate_worm.
+
+    Keys match the WormParameters fields (globoid throat fields excluded),
+    so a kept row can be built with WormParameters(**{k: v[i] ...}).
+
+    Args:
+        module: Axial module(s) (mm)
+        num_starts: Number(s) of thread starts
+        pitch_diameter: Pitch diameter(s) (mm)
+        clearance_factor: Bottom clearance as fraction of module
+        backlash: Backlash allowance (mm) - reduces thread thickness
+
+    Returns:
+        Dict of field name to list of values, one per input row
+    """
+    modules, starts, pitch_diameters = _broadcast(module, num_starts, pitch_diameter)
+    rows = list(map(_worm_kernel, modules, starts, pitch_diameters,
+                    repeat(clearance_factor), repeat(backlash)))
+
+    result = {"module": modules, "num_starts": starts, "pitch_diameter": pitch_diameters}
+    result.update(_columns(_WORM_KERNEL_FIELDS, rows))
+    return result
+
+
+def calculate_wheel_batch(
+    module: NumericInput,
+    num_teeth: NumericInput,
+    worm_lead_angle: NumericInput,
+    clearance_factor: float = 0.25,
+    profile_shift: float = 0.0
+) -> Dict[str, List[float]]:
+    """
+    Batch version of calculate_wheel.
+
+    Keys match the WheelParameters fields.
+
+    Args:
+        module: Transverse module(s) (mm)
+        num_teeth: Number(s) of teeth
+        worm_lead_angle: Lead angle(s) of mating worm (degrees)
+        clearance_factor: Bottom clearance as fraction of module
+        profile_shift: Profile shift coefficient
+
+    Returns:
+        Dict of field name to list of values, one per input row
+    """
+    modules, teeth, lead_angles = _broadcast(module, num_teeth, worm_lead_angle)
+    rows = list(map(_wheel_kernel, modules, teeth, lead_angles,
+                    repeat(clearance_factor), repeat(profile_shift)))
+
+    result = {"module": modules, "num_teeth": teeth}
+    result.update(_columns(_WHEEL_KERNEL_FIELDS, rows))
+    result["profile_shift"] = [profile_shift] * len(modules)
+    return result
+
+
+def _append_design(
+    batch: DesignBatch,
+    ratio: int,
+    num_starts: int,
+    module: float,
+    worm_pd: float,
+    clearance_factor: float,
+    backlash: float,
+    profile_shift: float,
+    tan_rho: float
+) -> None:
+    """Append one cylindrical design row once module and worm pitch diameter are known"""
+    num_teeth = ratio * num_starts
+
+    (worm_tip, worm_root, lead, axial_pitch, lead_angle,
+     _, _, _) = _worm_kernel(module, num_starts, worm_pd, clearance_factor, backlash)
+    (wheel_pd, wheel_tip, wheel_root,
+     _, _, _, _) = _wheel_kernel(module, num_teeth, lead_angle,
+                                 clearance_factor, profile_shift)
+
+    batch.ratio.append(ratio)
+    batch.num_starts.append(num_starts)
+    batch.num_teeth.append(num_teeth)
+    batch.module.append(module)
+    batch.worm_pitch_diameter.append(worm_pd)
+    batch.worm_tip_diameter.append(worm_tip)
+    batch.worm_root_diameter.append(worm_root)
+    batch.lead.append(lead)
+    batch.axial_pitch.append(axial_pitch)
+    batch.lead_angle.append(lead_angle)
+    batch.wheel_pitch_diameter.append(wheel_pd)
+    batch.wheel_tip_diameter.append(wheel_tip)
+    batch.wheel_root_diameter.append(wheel_root)
+    batch.centre_distance.append((worm_pd + wheel_pd) / 2)
+    # tan(lead angle) is module × starts / pitch diameter - no trig needed
+    batch.efficiency_estimate.append(
+        _efficiency_from_tangents(module * num_starts / worm_pd, tan_rho)
+    )
+    batch.self_locking.append(lead_angle < 6.0)
+
+
+def design_from_envelope_batch(
+    worm_od: NumericInput,
+    wheel_od: NumericInput,
+    ratio: NumericInput,
+    num_starts: NumericInput = 1,
+    pressure_angle: float = 20.0,
+    backlash: float = 0.0,
+    clearance_factor: float = 0.25,
+    profile_shift: float = 0.0
+) -> DesignBatch:
+    """
+    Batch version of design_from_envelope for cylindrical worms.
+
+    Each of worm_od, wheel_od, ratio and num_starts may be a scalar or a
+    sequence; scalars are broadcast against the sequences. Manufacturing
+    parameters and globoid throat geometry are not calculated - build a
+    full design with design_from_envelope for the candidates you keep.
+
+    Args:
+        worm_od: Worm outside/tip diameter(s) (mm)
+        wheel_od: Wheel outside/tip diameter(s) (mm)
+        ratio: Gear ratio(s)
+        num_starts: Number(s) of worm starts
+        pressure_angle: Pressure angle (degrees)
+        backlash: Backlash allowance (mm)
+        clearance_factor: Bottom clearance factor
+        profile_shift: Profile shift coefficient for wheel
+
+    Returns:
+        DesignBatch with one entry per input row
+    """
+    worm_ods, wheel_ods, ratios, starts = _broadcast(worm_od, wheel_od, ratio, num_starts)
+    batch = DesignBatch(pressure_angle=pressure_angle, backlash=backlash,
+                        clearance_factor=clearance_factor, profile_shift=profile_shift)
+    tan_rho = _tan_friction_angle(pressure_angle, 0.05)
+
+    for w_od, g_od, r, z1 in zip(worm_ods, wheel_ods, ratios, starts):
+        num_teeth = r * z1
+        module = g_od / (num_teeth + 2)
+        worm_pd = w_od - 2 * module
+
+        _append_design(batch, r, z1, module, worm_pd,
+                       clearance_factor, backlash, profile_shift, tan_rho)
+
+    return batch
+
+
+def design_from_centre_distance_batch(
+    centre_distance: NumericInput,
+    ratio: NumericInput,
+    worm_to_wheel_ratio: NumericInput = 0.3,
+    num_starts: NumericInput = 1,
+    pressure_angle: float = 20.0,
+    backlash: float = 0.0,
+    clearance_factor: float = 0.25,
+    profile_shift: float = 0.0
+) -> DesignBatch:
+    """
+    Batch version of design_from_centre_distance for cylindrical worms.
+
+    centre_distance, ratio, worm_to_wheel_ratio and num_starts may each be
+    a scalar or a sequence; scalars are broadcast against the sequences.
+
+    Args:
+        centre_distance: Required centre distance(s) (mm)
+        ratio: Gear ratio(s)
+        worm_to_wheel_ratio: Worm pitch dia / wheel pitch dia ratio(s)
+        num_starts: Number(s) of worm starts
+        pressure_angle: Pressure angle (degrees)
+        backlash: Backlash allowance (mm)
+        clearance_factor: Bottom clearance factor
+        profile_shift: Profile shift coefficient for wheel
+
+    Returns:
+        DesignBatch with one entry per input row
+    """
+    cds, ratios, ks, starts = _broadcast(centre_distance, ratio, worm_to_wheel_ratio, num_starts)
+    batch = DesignBatch(pressure_angle=pressure_angle, backlash=backlash,
+                        clearance_factor=clearance_factor, profile_shift=profile_shift)
+    tan_rho = _tan_friction_angle(pressure_angle, 0.05)
+
+    for cd, r, k, z1 in zip(cds, ratios, ks, starts):
+        module, worm_pd = _centre_distance_kernel(cd, r * z1, k)
+        _append_design(batch, r, z1, module, worm_pd,
+                       clearance_factor, backlash, profile_shift, tan_rho)
+
+    return batch
+
+
+def design_grid(
+    worm_od: NumericInput,
+    wheel_od: NumericInput,
+    ratio: NumericInput,
+    num_starts: NumericInput = 1,
+    pressure_angle: float = 20.0,
+    backlash: float = 0.0,
+    clearance_factor: float = 0.25,
+    profile_shift: float = 0.0
+) -> DesignBatch:
+    """
+    Evaluate every combination of the given envelope axes.
+
+    Unlike design_from_envelope_batch, which pairs inputs row by row, this
+    takes the Cartesian product of the axes (e.g. 5 worm ODs × 4 ratios ×
+    3 start counts = 60 rows). Rows vary fastest along num_starts, then
+    ratio, wheel_od and worm_od.
+
+    Args:
+        worm_od: Worm outside/tip diameter(s) (mm)
+        wheel_od: Wheel outside/tip diameter(s) (mm)
+        ratio: Gear ratio(s)
+        num_starts: Number(s) of worm starts
+        pressure_angle: Pressure angle (degrees)
+        backlash: Backlash allowance (mm)
+        clearance_factor: Bottom clearance factor
+        profile_shift: Profile shift coefficient for wheel
+
+    Returns:
+        DesignBatch with one entry per combination
+    """
+    axes = [
+        [v] if isinstance(v, Number) else list(v)
+        for v in (worm_od, wheel_od, ratio, num_starts)
+    ]
+    columns = list(zip(*product(*axes))) or [[], [], [], []]
+
+    return design_from_envelope_batch(
+        *columns,
+        pressure_angle=pressure_angle,
+        backlash=backlash,
+        clearance_factor=clearance_factor,
+        profile_shift=profile_shift
+    )
+
+
+def is_valid_batch(batch: DesignBatch) -> List[bool]:
+    """
+    Check every row of a batch for validation errors.
+
+    Row i is True exactly when is_valid(batch.design(i)) would be, but only
+    the ERROR-level rules that can fire for cylindrical ZA designs are
+    evaluated, straight from the columns.
+
+    Args:
+        batch: Batch design results
+
+    Returns:
+        One flag per row, True if the design has no errors
+    """
+    z_min = calculate_minimum_teeth(batch.pressure_angle)
+
+    return [
+        not (la < _MIN_LEAD_ANGLE or m < _MIN_MODULE or z < z_min
+             or pd / m < _MIN_WORM_DIA_TO_MODULE or root < _MIN_WORM_ROOT_DIAMETER
+             or cd - tip / 2 - wheel_root / 2 < _MIN_CLEARANCE)
+        for la, m, z, pd, root, tip, wheel_root, cd in zip(
+            batch.lead_angle, batch.module, batch.num_teeth,
+            batch.worm_pitch_diameter, batch.worm_root_diameter,
+            batch.worm_tip_diameter, batch.wheel_root_diameter,
+            batch.centre_distance
+        )
+    ]
+
+
+def estimate_efficiency_batch(
+    lead_angle_deg: Sequence[float],
+    pressure_angle_deg: float = 20.0,
+    friction_coefficient: float = 0.05
+) -> List[float]:
+    """
+    Batch version of estimate_efficiency over many lead angles.
+
+    The friction angle depends only on pressure angle and friction
+    coefficient, so it is calculated once for the whole sweep.
+
+    Args:
+        lead_angle_deg: Lead angles (degrees)
+        pressure_angle_deg: Pressure angle (degrees)
+        friction_coefficient: Coefficient of friction
+
+    Returns:
+        Efficiency estimates (0-1), one per lead angle
+    """
+    tan_rho = _tan_friction_angle(pressure_angle_deg, friction_coefficient)
+    rho = _friction_angle(pressure_angle_deg, friction_coefficient)
+    return [_efficiency_at_angle(la * _DEG2RAD, tan_rho, rho) for la in lead_angle_deg]
+
+
+def nearest_standard_module_batch(modules: Sequence[float]) -> List[float]:
+    """
+    Snap many candidate modules to their nearest ISO standard module.
+
+    Each lookup is a bisect on the sorted STANDARD_MODULES table, so the
+    cost is O(log n) per module with ties going to the smaller module, as
+    in nearest_standard_module.
+
+    Args:
+        modules: Candidate modules (mm)
+
+    Returns:
+        Nearest standard modules, one per candidate
+    """
+    return list(map(nearest_standard_module, modules))
@@ -10,23 +10,35 @@ Reference standards:
 - ISO 54 (standard modules)
 """
 
-from dataclasses import dataclass, field
-from math import pi, tan, atan, degrees, radians, cos, sin, sqrt
-from typing import Optional, List, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from math import pi, tan, atan, cos, sin, sqrt
+from typing import List, Optional, Tuple
 from enum import Enum
 
 
 # ISO 54 / DIN 780 standard modules (mm)
-STANDARD_MODULES = [
+# Sorted ascending; a tuple so it can't be mutated and works with bisect
+STANDARD_MODULES = (
     0.3, 0.4, 0.5, 0.6, 0.7, 0.75, 0.8, 0.9, 1.0,
     1.125, 1.25, 1.375, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75,
     3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0, 7.0, 8.0, 9.0, 10.0,
     11.0, 12.0, 14.0, 16.0, 18.0, 20.0, 22.0, 25.0
-]
+)
 
+# STANDARD_MODULES grouped by size range, for listing
+SMALL_MODULES = tuple(m for m in STANDARD_MODULES if m < 1)        # < 1mm
+MEDIUM_MODULES = tuple(m for m in STANDARD_MODULES if 1 <= m < 5)  # 1-5mm
+LARGE_MODULES = tuple(m for m in STANDARD_MODULES if m >= 5)       # ≥ 5mm
 
-class Hand(Enum):
-    """Thread hand / helix direction"""
+# Angle conversion constants (same factors math.radians/degrees use)
+_DEG2RAD = pi / 180.0
+_RAD2DEG = 180.0 / pi
+
+
+class Hand(str, Enum):
+    """Thread hand / helix direction (members compare equal to their values)"""
     RIGHT = "right"
     LEFT = "left"
 
@@ -43,7 +55,7 @@ class WormType(Enum):
     GLOBOID = "globoid"  # Hourglass-shaped worm for better contact
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WormParameters:
     """Calculated worm dimensions"""
     module: float                   # Axial module (mm)
@@ -62,21 +74,19 @@ class WormParameters:
     throat_pitch_radius: Optional[float] = None  # Pitch radius at throat (mm)
     throat_tip_radius: Optional[float] = None    # Outer radius at throat (mm)
     throat_root_radius: Optional[float] = None   # Inner radius at throat (mm)
+    # Derived radii (set in __post_init__)
+    pitch_radius: float = field(init=False, repr=False, compare=False)
+    tip_radius: float = field(init=False, repr=False, compare=False)
+    root_radius: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def pitch_radius(self) -> float:
-        return self.pitch_diameter / 2
-
-    @property
-    def tip_radius(self) -> float:
-        return self.tip_diameter / 2
-
-    @property
-    def root_radius(self) -> float:
-        return self.root_diameter / 2
+    def __post_init__(self):
+        # Frozen dataclass, so bypass __setattr__ for the derived fields
+        object.__setattr__(self, "pitch_radius", self.pitch_diameter * 0.5)
+        object.__setattr__(self, "tip_radius", self.tip_diameter * 0.5)
+        object.__setattr__(self, "root_radius", self.root_diameter * 0.5)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WheelParameters:
     """Calculated worm wheel dimensions"""
     module: float                   # Transverse module (mm)
@@ -89,21 +99,19 @@ class WheelParameters:
     addendum: float                 # Tooth height above pitch (mm)
     dedendum: float                 # Tooth depth below pitch (mm)
     profile_shift: float = 0.0      # Profile shift coefficient (dimensionless)
-    
-    @property
-    def pitch_radius(self) -> float:
-        return self.pitch_diameter / 2
-    
-    @property
-    def tip_radius(self) -> float:
-        return self.tip_diameter / 2
-    
-    @property
-    def root_radius(self) -> float:
-        return self.root_diameter / 2
+    # Derived radii (set in __post_init__)
+    pitch_radius: float = field(init=False, repr=False, compare=False)
+    tip_radius: float = field(init=False, repr=False, compare=False)
+    root_radius: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass, so bypass __setattr__ for the derived fields
+        object.__setattr__(self, "pitch_radius", self.pitch_diameter * 0.5)
+        object.__setattr__(self, "tip_radius", self.tip_diameter * 0.5)
+        object.__setattr__(self, "root_radius", self.root_diameter * 0.5)
 
 
-@dataclass
+@dataclass(slots=True)
 class ManufacturingParams:
     """Manufacturing parameters for geometry generation (worm-gear-3d compatibility)"""
     worm_type: WormType = WormType.CYLINDRICAL  # Worm geometry type
@@ -113,7 +121,7 @@ class ManufacturingParams:
     profile: WormProfile = WormProfile.ZA       # Tooth profile type per DIN 3975
 
 
-@dataclass
+@dataclass(slots=True)
 class WormGearDesign:
     """Complete worm gear pair design"""
     worm: WormParameters
@@ -150,8 +158,47 @@ class WormGearDesign:
         if self.manufacturing is None:
             self.manufacturing = ManufacturingParams(profile=self.profile)
 
+    @classmethod
+    def from_computed(
+        cls,
+        worm: WormParameters,
+        wheel: WheelParameters,
+        centre_distance: float,
+        ratio: float,
+        pressure_angle: float,
+        backlash: float,
+        hand: Hand,
+        efficiency_estimate: float,
+        self_locking: bool,
+        profile: WormProfile = WormProfile.ZA,
+        manufacturing: Optional[ManufacturingParams] = None
+    ) -> "WormGearDesign":
+        """
+        Build a design from already-computed performance estimates.
+
+        Skips __post_init__, so efficiency_estimate and self_locking are
+        trusted as given. For the design functions, which calculate them
+        from the lead angle anyway; other callers should use the normal
+        constructor.
+        """
+        design = object.__new__(cls)
+        design.worm = worm
+        design.wheel = wheel
+        design.centre_distance = centre_distance
+        design.ratio = ratio
+        design.pressure_angle = pressure_angle
+        design.backlash = backlash
+        design.hand = hand
+        design.efficiency_estimate = efficiency_estimate
+        design.self_locking = self_locking
+        design.profile = profile
+        design.manufacturing = (
+            manufacturing if manufacturing is not None else ManufacturingParams(profile=profile)
+        )
+        return design
+
 
-@dataclass
+@dataclass(slots=True)
 class DesignResult:
     """Result from design calculation including validation"""
     design: Optional[WormGearDesign]
@@ -161,17 +208,185 @@ class DesignResult:
     suggestions: List[str] = field(default_factory=list)
 
 
+@lru_cache(maxsize=1024)
 def nearest_standard_module(module: float) -> float:
     """Find nearest ISO standard module"""
-    return min(STANDARD_MODULES, key=lambda m: abs(m - module))
+    i = bisect_left(STANDARD_MODULES, module)
+    if i == 0:
+        return STANDARD_MODULES[0]
+    if i == len(STANDARD_MODULES):
+        return STANDARD_MODULES[-1]
+
+    below = STANDARD_MODULES[i - 1]
+    above = STANDARD_MODULES[i]
+    # Ties go to the smaller module, as min() over the sorted list did
+    return below if module - below <= above - module else above
 
 
 def is_standard_module(module: float, tolerance: float = 0.001) -> bool:
     """Check if module is a standard value"""
+    return classify_module(module, tolerance)[0]
+
+
+def classify_module(module: float, tolerance: float = 0.001) -> Tuple[bool, float, float]:
+    """
+    Classify a module against the ISO standard table with a single lookup.
+
+    Args:
+        module: Module (mm)
+        tolerance: Maximum difference from a standard value to count as standard (mm)
+
+    Returns:
+        Tuple of (is_standard, nearest_standard, deviation_percent)
+    """
     nearest = nearest_standard_module(module)
-    return abs(module - nearest) < tolerance
+    difference = abs(module - nearest)
+    is_standard = difference < tolerance
+    return is_standard, nearest, difference / nearest * 100
+
+
+def _efficiency_kernel(
+    lead_angle_deg: float,
+    pressure_angle_deg: float,
+    friction_coefficient: float
+) -> float:
+    """Scalar efficiency calculation (see estimate_efficiency for the model)"""
+    return _efficiency_at_angle(
+        lead_angle_deg * _DEG2RAD,
+        _tan_friction_angle(pressure_angle_deg, friction_coefficient),
+        _friction_angle(pressure_angle_deg, friction_coefficient)
+    )
+
+
+@lru_cache(maxsize=32)
+def _tan_friction_angle(pressure_angle_deg: float, friction_coefficient: float) -> float:
+    """
+    tan(ρ) = μ / cos(α) for friction angle ρ.
+
+    Memoized separately from estimate_efficiency: a sweep uses one or two
+    pressure angles, so cos(α) is evaluated once rather than per lead angle.
+    """
+    return friction_coefficient / cos(pressure_angle_deg * _DEG2RAD)
+
+
+@lru_cache(maxsize=32)
+def _friction_angle(pressure_angle_deg: float, friction_coefficient: float) -> float:
+    """Friction angle ρ (radians), memoized like _tan_friction_angle"""
+    return atan(_tan_friction_angle(pressure_angle_deg, friction_coefficient))
+
+
+def _efficiency_at_angle(gamma: float, tan_rho: float, rho: float) -> float:
+    """
+    Efficiency at lead angle γ (radians).
+
+    Zero once γ + ρ reaches 90°. The check is on the angle itself: tan γ
+    repeats every 180°, so the tangents alone can't tell 95° from -85°.
+    """
+    if gamma + rho >= pi / 2:
+        return 0.0
+    return _efficiency_from_tangents(tan(gamma), tan_rho)
+
+
+def _efficiency_from_tangents(tan_gamma: float, tan_rho: float) -> float:
+    """
+    Efficiency from tan(γ) and tan(ρ), without further trig.
+
+    tan(γ + ρ) = (tan γ + tan ρ) / (1 - tan γ·tan ρ), so
+    η = tan γ / tan(γ + ρ) = tan γ·(1 - tan γ·tan ρ) / (tan γ + tan ρ).
+    For 0 < γ < 90°, γ + ρ ≥ 90° exactly when tan γ·tan ρ ≥ 1, where
+    efficiency is zero. Use _efficiency_at_angle for arbitrary lead angles.
+    """
+    margin = 1.0 - tan_gamma * tan_rho
+    if margin <= 0.0:
+        return 0.0
+
+    efficiency = tan_gamma * margin / (tan_gamma + tan_rho)
+    return max(0.0, min(1.0, efficiency))
+
+
+def _worm_kernel(
+    module: float,
+    num_starts: int,
+    pitch_diameter: float,
+    clearance_factor: float,
+    backlash: float,
+    lead_angle: Optional[float] = None
+) -> Tuple[float, float, float, float, float, float, float, float]:
+    """
+    Scalar worm geometry, free of dataclass construction.
+
+    If lead_angle (degrees) is already known - because pitch_diameter was
+    derived from it - it is used as-is instead of recovering it with atan.
+
+    Returns:
+        Tuple of (tip_diameter, root_diameter, lead, axial_pitch, lead_angle,
+        addendum, dedendum, thread_thickness)
+    """
+    # Axial pitch
+    axial_pitch = module * pi
+
+    # Lead = π × module × starts; keep the π-free part for the lead angle
+    lead_over_pi = module * num_starts
+    lead = pi * lead_over_pi
+
+    # Lead angle = atan(lead / (π × pitch_dia)), π cancels
+    if lead_angle is None:
+        lead_angle = atan(lead_over_pi / pitch_diameter) * _RAD2DEG
+
+    # Tooth proportions
+    addendum = module
+    dedendum = module * (1 + clearance_factor)
+
+    # Diameters
+    tip_diameter = pitch_diameter + 2 * addendum
+    root_diameter = pitch_diameter - 2 * dedendum
+
+    # Thread thickness at pitch line (nominal is half axial pitch)
+    # Reduce by backlash allowance
+    thread_thickness = (axial_pitch / 2) - backlash
+
+    return (tip_diameter, root_diameter, lead, axial_pitch, lead_angle,
+            addendum, dedendum, thread_thickness)
+
+
+def _wheel_kernel(
+    module: float,
+    num_teeth: int,
+    worm_lead_angle: float,
+    clearance_factor: float,
+    profile_shift: float
+) -> Tuple[float, float, float, float, float, float, float]:
+    """
+    Scalar wheel geometry, free of dataclass construction.
+
+    Returns:
+        Tuple of (pitch_diameter, tip_diameter, root_diameter, throat_diameter,
+        helix_angle, addendum, dedendum)
+    """
+    # Pitch diameter (unaffected by profile shift)
+    pitch_diameter = module * num_teeth
+
+    # Tooth proportions with profile shift
+    # Profile shift moves the reference line relative to the pitch circle
+    addendum = module * (1.0 + profile_shift)
+    dedendum = module * (1.0 + clearance_factor - profile_shift)
+
+    # Diameters
+    tip_diameter = pitch_diameter + 2 * addendum
+    root_diameter = pitch_diameter - 2 * dedendum
+
+    # Throat diameter (for enveloping geometry)
+    # This is the diameter at the deepest point of the throat
+    throat_diameter = pitch_diameter + module  # Simplified
 
+    # Helix angle = 90° - lead angle (for perpendicular axes)
+    helix_angle = 90.0 - worm_lead_angle
+
+    return (pitch_diameter, tip_diameter, root_diameter, throat_diameter,
+            helix_angle, addendum, dedendum)
 
+
+@lru_cache(maxsize=2048)
 def estimate_efficiency(lead_angle_deg: float, pressure_angle_deg: float = 20.0, 
                         friction_coefficient: float = 0.05) -> float:
     """
@@ -190,19 +405,11 @@ def estimate_efficiency(lead_angle_deg: float, pressure_angle_deg: float = 20.0,
     - Steel on bronze, lubricated: 0.03-0.05
     - Steel on cast iron: 0.05-0.08
     - Steel on steel: 0.08-0.12
+
+    Results are memoized, as sweeps repeat the same pressure angle and
+    friction coefficient. Use estimate_efficiency.cache_clear() to reset.
     """
-    gamma = radians(lead_angle_deg)
-    alpha = radians(pressure_angle_deg)
-    
-    # Friction angle
-    rho = atan(friction_coefficient / cos(alpha))
-    
-    # Efficiency
-    if gamma + rho >= pi / 2:
-        return 0.0
-    
-    efficiency = tan(gamma) / tan(gamma + rho)
-    return max(0.0, min(1.0, efficiency))
+    return _efficiency_kernel(lead_angle_deg, pressure_angle_deg, friction_coefficient)
 
 
 def calculate_worm(
@@ -211,7 +418,8 @@ def calculate_worm(
     pitch_diameter: float,
     pressure_angle: float = 20.0,
     clearance_factor: float = 0.25,
-    backlash: float = 0.0
+    backlash: float = 0.0,
+    _known_lead_angle: Optional[float] = None
 ) -> WormParameters:
     """
     Calculate worm dimensions from basic parameters.
@@ -223,32 +431,17 @@ def calculate_worm(
         pressure_angle: Pressure angle (degrees)
         clearance_factor: Bottom clearance as fraction of module
         backlash: Backlash allowance (mm) - reduces thread thickness
+        _known_lead_angle: Internal - lead angle pitch_diameter was derived from
     
     Returns:
         WormParameters with all dimensions
     """
-    # Axial pitch
-    axial_pitch = module * pi
-    
-    # Lead
-    lead = axial_pitch * num_starts
-    
-    # Lead angle
-    lead_angle_rad = atan(lead / (pi * pitch_diameter))
-    lead_angle = degrees(lead_angle_rad)
-    
-    # Tooth proportions
-    addendum = module
-    dedendum = module * (1 + clearance_factor)
-    
-    # Diameters
-    tip_diameter = pitch_diameter + 2 * addendum
-    root_diameter = pitch_diameter - 2 * dedendum
-    
-    # Thread thickness at pitch line (nominal is half axial pitch)
-    # Reduce by backlash allowance
-    thread_thickness = (axial_pitch / 2) - backlash
-    
+    (tip_diameter, root_diameter, lead, axial_pitch, lead_angle,
+     addendum, dedendum, thread_thickness) = _worm_kernel(
+        module, num_starts, pitch_diameter, clearance_factor, backlash,
+        _known_lead_angle
+    )
+
     return WormParameters(
         module=module,
         num_starts=num_starts,
@@ -289,24 +482,10 @@ def calculate_wheel(
     Returns:
         WheelParameters with all dimensions
     """
-    # Pitch diameter (unaffected by profile shift)
-    pitch_diameter = module * num_teeth
-
-    # Tooth proportions with profile shift
-    # Profile shift moves the reference line relative to the pitch circle
-    addendum = module * (1.0 + profile_shift)
-    dedendum = module * (1.0 + clearance_factor - profile_shift)
-
-    # Diameters
-    tip_diameter = pitch_diameter + 2 * addendum
-    root_diameter = pitch_diameter - 2 * dedendum
-
-    # Throat diameter (for enveloping geometry)
-    # This is the diameter at the deepest point of the throat
-    throat_diameter = pitch_diameter + module  # Simplified
-
-    # Helix angle = 90° - lead angle (for perpendicular axes)
-    helix_angle = 90.0 - worm_lead_angle
+    (pitch_diameter, tip_diameter, root_diameter, throat_diameter,
+     helix_angle, addendum, dedendum) = _wheel_kernel(
+        module, num_teeth, worm_lead_angle, clearance_factor, profile_shift
+    )
 
     return WheelParameters(
         module=module,
@@ -464,55 +643,88 @@ def calculate_manufacturing_params(
     )
 
 
-def design_from_envelope(
-    worm_od: float,
-    wheel_od: float,
-    ratio: int,
-    pressure_angle: float = 20.0,
-    backlash: float = 0.0,
-    num_starts: int = 1,
-    clearance_factor: float = 0.25,
-    hand: Hand = Hand.RIGHT,
-    profile_shift: float = 0.0,
-    profile: WormProfile = WormProfile.ZA,
-    worm_type: WormType = WormType.CYLINDRICAL,
-    throat_reduction: float = 0.0,
-    wheel_throated: bool = False
-) -> WormGearDesign:
+def _centre_distance_kernel(
+    centre_distance: float,
+    num_teeth: int,
+    worm_to_wheel_ratio: float
+) -> Tuple[float, float]:
     """
-    Design worm gear pair from outside diameter constraints.
+    Solve module and worm pitch diameter for a (standard) centre distance.
 
-    Args:
-        worm_od: Worm outside/tip diameter (mm)
-        wheel_od: Wheel outside/tip diameter (mm)
-        ratio: Gear ratio (must be divisible by num_starts)
-        pressure_angle: Pressure angle (degrees)
-        backlash: Backlash allowance (mm)
-        num_starts: Number of worm starts
-        clearance_factor: Bottom clearance factor
-        hand: Thread hand
-        profile_shift: Profile shift coefficient for wheel (dimensionless, default 0.0)
-        profile: Tooth profile type per DIN 3975 (ZA or ZK)
-        worm_type: Worm geometry type (cylindrical or globoid)
-        throat_reduction: Throat reduction for globoid worms (mm, default 0.0)
-                         Typical: 0.05-0.1mm for small gears, 0.1-0.2mm for medium
-        wheel_throated: Whether wheel has throated teeth (hobbed)
+    centre_distance = (worm_pd + wheel_pd) / 2
+    wheel_pd = module × num_teeth
+    worm_pd = k × wheel_pd (where k = worm_to_wheel_ratio)
+
+    2 × cd = k × wheel_pd + wheel_pd = wheel_pd × (k + 1)
+    wheel_pd = 2 × cd / (k + 1)
 
     Returns:
-        WormGearDesign with all parameters
+        Tuple of (module, worm_pitch_diameter)
     """
-    # Number of teeth on wheel
-    num_teeth = ratio * num_starts
+    wheel_pitch_diameter = 2 * centre_distance / (worm_to_wheel_ratio + 1)
+    worm_pitch_diameter = centre_distance * 2 - wheel_pitch_diameter
 
-    # Calculate module from wheel OD
-    # tip_diameter = module × (num_teeth + 2)
-    module = wheel_od / (num_teeth + 2)
+    # Module from wheel
+    return wheel_pitch_diameter / num_teeth, worm_pitch_diameter
 
-    # Worm pitch diameter from OD
-    addendum = module
-    dedendum = module * (1 + clearance_factor)
-    worm_pitch_diameter = worm_od - 2 * addendum
 
+def _passthrough_lead_angle(target_lead_angle: float, worm_type: WormType) -> Optional[float]:
+    """
+    Lead angle to pass through to _design_core for a target-angle design.
+
+    The globoid pitch diameter is bumped by the throat reduction, so its
+    lead angle no longer equals the target and must be recalculated.
+    """
+    return float(target_lead_angle) if worm_type is WormType.CYLINDRICAL else None
+
+
+def _worm_pitch_diameter_for_lead_angle(
+    module: float,
+    num_starts: int,
+    target_lead_angle: float,
+    worm_type: WormType,
+    throat_reduction: float
+) -> float:
+    """
+    Worm pitch diameter giving the target lead angle.
+
+    lead_angle = atan(lead / (π × pitch_dia)) with lead = π × module × starts,
+    so pitch_dia = module × starts / tan(lead_angle) - π cancels.
+    """
+    worm_pitch_diameter = module * num_starts / tan(target_lead_angle * _DEG2RAD)
+
+    # For globoid, increase pitch diameter to create hourglass effect
+    if worm_type is WormType.GLOBOID:
+        worm_pitch_diameter += 2 * throat_reduction
+
+    return worm_pitch_diameter
+
+
+def _design_core(
+    module: float,
+    num_teeth: int,
+    worm_pitch_diameter: float,
+    ratio: int,
+    pressure_angle: float,
+    backlash: float,
+    num_starts: int,
+    clearance_factor: float,
+    hand: Hand,
+    profile_shift: float,
+    profile: WormProfile,
+    worm_type: WormType,
+    throat_reduction: float,
+    wheel_throated: bool,
+    lead_angle: Optional[float] = None
+) -> WormGearDesign:
+    """
+    Build a complete design once module and worm pitch diameter are known.
+
+    Every design_from_* mode reduces its inputs to these values and calls
+    this directly, so none of them round-trips through outside diameters.
+    Modes that derive the pitch diameter from a lead angle pass that angle
+    too, so it isn't recovered with atan.
+    """
     # Calculate components
     worm = calculate_worm(
         module=module,
@@ -520,7 +732,8 @@ def design_from_envelope(
         pitch_diameter=worm_pitch_diameter,
         pressure_angle=pressure_angle,
         clearance_factor=clearance_factor,
-        backlash=backlash
+        backlash=backlash,
+        _known_lead_angle=lead_angle
     )
 
     wheel = calculate_wheel(
@@ -541,32 +754,22 @@ def design_from_envelope(
         wheel.pitch_diameter
     )
 
-    if worm_type == WormType.GLOBOID:
+    if worm_type is WormType.GLOBOID:
         centre_distance = standard_centre_distance - throat_reduction
     else:
         centre_distance = standard_centre_distance
 
     # Calculate globoid throat radii if needed
-    if worm_type == WormType.GLOBOID:
+    if worm_type is WormType.GLOBOID:
         throat_pitch, throat_tip, throat_root = calculate_globoid_throat_radii(
             centre_distance=centre_distance,
             wheel_pitch_diameter=wheel.pitch_diameter,
             addendum=worm.addendum,
             dedendum=worm.dedendum
         )
-        # Update worm with throat parameters
-        worm = WormParameters(
-            module=worm.module,
-            num_starts=worm.num_starts,
-            pitch_diameter=worm.pitch_diameter,
-            tip_diameter=worm.tip_diameter,
-            root_diameter=worm.root_diameter,
-            lead=worm.lead,
-            axial_pitch=worm.axial_pitch,
-            lead_angle=worm.lead_angle,
-            addendum=worm.addendum,
-            dedendum=worm.dedendum,
-            thread_thickness=worm.thread_thickness,
+        # Frozen dataclass, so attach throat parameters via a copy
+        worm = replace(
+            worm,
             throat_reduction=throat_reduction,
             throat_pitch_radius=throat_pitch,
             throat_tip_radius=throat_tip,
@@ -583,7 +786,7 @@ def design_from_envelope(
         worm_pitch_diameter=worm.pitch_diameter
     )
 
-    return WormGearDesign(
+    return WormGearDesign.from_computed(
         worm=worm,
         wheel=wheel,
         centre_distance=centre_distance,
@@ -592,12 +795,78 @@ def design_from_envelope(
         backlash=backlash,
         hand=hand,
         profile=profile,
-        efficiency_estimate=0,  # Set in __post_init__
-        self_locking=False,     # Set in __post_init__
+        efficiency_estimate=estimate_efficiency(worm.lead_angle, pressure_angle),
+        self_locking=worm.lead_angle < 6.0,
         manufacturing=manufacturing
     )
 
 
+def design_from_envelope(
+    worm_od: float,
+    wheel_od: float,
+    ratio: int,
+    pressure_angle: float = 20.0,
+    backlash: float = 0.0,
+    num_starts: int = 1,
+    clearance_factor: float = 0.25,
+    hand: Hand = Hand.RIGHT,
+    profile_shift: float = 0.0,
+    profile: WormProfile = WormProfile.ZA,
+    worm_type: WormType = WormType.CYLINDRICAL,
+    throat_reduction: float = 0.0,
+    wheel_throated: bool = False
+) -> WormGearDesign:
+    """
+    Design worm gear pair from outside diameter constraints.
+
+    Args:
+        worm_od: Worm outside/tip diameter (mm)
+        wheel_od: Wheel outside/tip diameter (mm)
+        ratio: Gear ratio (must be divisible by num_starts)
+        pressure_angle: Pressure angle (degrees)
+        backlash: Backlash allowance (mm)
+        num_starts: Number of worm starts
+        clearance_factor: Bottom clearance factor
+        hand: Thread hand
+        profile_shift: Profile shift coefficient for wheel (dimensionless, default 0.0)
+        profile: Tooth profile type per DIN 3975 (ZA or ZK)
+        worm_type: Worm geometry type (cylindrical or globoid)
+        throat_reduction: Throat reduction for globoid worms (mm, default 0.0)
+                         Typical: 0.05-0.1mm for small gears, 0.1-0.2mm for medium
+        wheel_throated: Whether wheel has throated teeth (hobbed)
+
+    Returns:
+        WormGearDesign with all parameters
+    """
+    # Number of teeth on wheel
+    num_teeth = ratio * num_starts
+
+    # Calculate module from wheel OD
+    # tip_diameter = module × (num_teeth + 2)
+    module = wheel_od / (num_teeth + 2)
+
+    # Worm pitch diameter from OD
+    addendum = module
+    worm_pitch_diameter = worm_od - 2 * addendum
+
+    return _design_core(
+        module=module,
+        num_teeth=num_teeth,
+        worm_pitch_diameter=worm_pitch_diameter,
+        ratio=ratio,
+        pressure_angle=pressure_angle,
+        backlash=backlash,
+        num_starts=num_starts,
+        clearance_factor=clearance_factor,
+        hand=hand,
+        profile_shift=profile_shift,
+        profile=profile,
+        worm_type=worm_type,
+        throat_reduction=throat_reduction,
+        wheel_throated=wheel_throated
+    )
+
+
 def design_from_wheel(
     wheel_od: float,
     ratio: int,
@@ -642,25 +911,15 @@ def design_from_wheel(
     module = wheel_od / (num_teeth + 2)
 
     # Calculate worm pitch diameter for target lead angle
-    # lead_angle = atan(lead / (π × pitch_dia))
-    # pitch_dia = lead / (π × tan(lead_angle))
-    lead = pi * module * num_starts
-    target_rad = radians(target_lead_angle)
-    worm_pitch_diameter_cylindrical = lead / (pi * tan(target_rad))
-
-    # For globoid, increase pitch diameter to create hourglass effect
-    if worm_type == WormType.GLOBOID:
-        worm_pitch_diameter = worm_pitch_diameter_cylindrical + 2 * throat_reduction
-    else:
-        worm_pitch_diameter = worm_pitch_diameter_cylindrical
-
-    # Worm OD
-    addendum = module
-    worm_od = worm_pitch_diameter + 2 * addendum
+    worm_pitch_diameter = _worm_pitch_diameter_for_lead_angle(
+        module, num_starts, target_lead_angle, worm_type, throat_reduction
+    )
+    lead_angle = _passthrough_lead_angle(target_lead_angle, worm_type)
 
-    return design_from_envelope(
-        worm_od=worm_od,
-        wheel_od=wheel_od,
+    return _design_core(
+        module=module,
+        num_teeth=num_teeth,
+        worm_pitch_diameter=worm_pitch_diameter,
         ratio=ratio,
         pressure_angle=pressure_angle,
         backlash=backlash,
@@ -671,7 +930,8 @@ def design_from_wheel(
         profile=profile,
         worm_type=worm_type,
         throat_reduction=throat_reduction,
-        wheel_throated=wheel_throated
+        wheel_throated=wheel_throated,
+        lead_angle=lead_angle
     )
 
 
@@ -716,30 +976,19 @@ def design_from_module(
     # Number of teeth on wheel
     num_teeth = ratio * num_starts
 
-    # Wheel OD
-    addendum = module
-    wheel_od = module * num_teeth + 2 * addendum
-
     # Worm pitch diameter
+    lead_angle = None
     if worm_pitch_diameter is None:
-        # Calculate for target lead angle
-        lead = pi * module * num_starts
-        target_rad = radians(target_lead_angle)
-        worm_pitch_diameter_cylindrical = lead / (pi * tan(target_rad))
-
-        # For globoid, increase pitch diameter to create hourglass effect
-        if worm_type == WormType.GLOBOID:
-            worm_pitch_diameter = worm_pitch_diameter_cylindrical + 2 * throat_reduction
-        else:
-            worm_pitch_diameter = worm_pitch_diameter_cylindrical
+        worm_pitch_diameter = _worm_pitch_diameter_for_lead_angle(
+            module, num_starts, target_lead_angle, worm_type, throat_reduction
+        )
+        lead_angle = _passthrough_lead_angle(target_lead_angle, worm_type)
     # else: use provided worm_pitch_diameter (assumed to be nominal for globoid)
 
-    # Worm OD
-    worm_od = worm_pitch_diameter + 2 * addendum
-
-    return design_from_envelope(
-        worm_od=worm_od,
-        wheel_od=wheel_od,
+    return _design_core(
+        module=module,
+        num_teeth=num_teeth,
+        worm_pitch_diameter=worm_pitch_diameter,
         ratio=ratio,
         pressure_angle=pressure_angle,
         backlash=backlash,
@@ -750,7 +999,8 @@ def design_from_module(
         profile=profile,
         worm_type=worm_type,
         throat_reduction=throat_reduction,
-        wheel_throated=wheel_throated
+        wheel_throated=wheel_throated,
+        lead_angle=lead_angle
     )
 
 
@@ -796,33 +1046,19 @@ def design_from_centre_distance(
     # For globoid, the given centre_distance is the actual distance
     # We need to calculate what the standard centre would be
     # standard_centre = centre_distance + throat_reduction
-    if worm_type == WormType.GLOBOID:
+    if worm_type is WormType.GLOBOID:
         standard_centre_distance = centre_distance + throat_reduction
     else:
         standard_centre_distance = centre_distance
 
-    # Solve for diameters
-    # standard_centre_distance = (worm_pd + wheel_pd) / 2
-    # wheel_pd = module × num_teeth
-    # worm_pd = k × wheel_pd (where k = worm_to_wheel_ratio)
-    #
-    # 2 × cd = k × wheel_pd + wheel_pd = wheel_pd × (k + 1)
-    # wheel_pd = 2 × cd / (k + 1)
-
-    wheel_pitch_diameter = 2 * standard_centre_distance / (worm_to_wheel_ratio + 1)
-    worm_pitch_diameter = standard_centre_distance * 2 - wheel_pitch_diameter
-
-    # Module from wheel
-    module = wheel_pitch_diameter / num_teeth
-
-    # ODs
-    addendum = module
-    worm_od = worm_pitch_diameter + 2 * addendum
-    wheel_od = wheel_pitch_diameter + 2 * addendum
+    module, worm_pitch_diameter = _centre_distance_kernel(
+        standard_centre_distance, num_teeth, worm_to_wheel_ratio
+    )
 
-    return design_from_envelope(
-        worm_od=worm_od,
-        wheel_od=wheel_od,
+    return _design_core(
+        module=module,
+        num_teeth=num_teeth,
+        worm_pitch_diameter=worm_pitch_diameter,
         ratio=ratio,
         pressure_angle=pressure_angle,
         backlash=backlash,